@@ -8,43 +8,132 @@ import signal
 import re
 import unicodedata
 import hashlib
+import html
+import queue
 import argparse
-import ctypes
-import webbrowser
 
+from collections import OrderedDict
+from functools import lru_cache
 from urllib.parse import urlparse
 from omdbapi.movie_search import GetMovie
-from PyQt5.QtWidgets import QSystemTrayIcon, QMenu
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QTreeWidget, QTreeWidgetItem,
     QSplitter, QMessageBox, QAction, QFileDialog, QMenu, QToolBar,
     QHeaderView, QDialog, QFormLayout, QSizePolicy, QStyle, QSpinBox,
     QAbstractItemView, QInputDialog, QDialogButtonBox, QCheckBox,
-    QSplashScreen
+    QSplashScreen, QSystemTrayIcon, QFontComboBox
 )
-from PyQt5.QtGui import QCursor
-from PyQt5.QtWidgets import QFontComboBox
 
 from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings, QWebEnginePage
 from PyQt5.QtCore import (
     Qt, QTimer, QThread, pyqtSignal, QUrl, QSettings, QSize, QEvent, QObject, QRunnable, QThreadPool, pyqtSlot
 )
 from PyQt5.QtGui import (
-    QDesktopServices, QFont, QIcon, QPixmap, QPainter, QBrush, QColor, QTransform
+    QDesktopServices, QFont, QIcon, QPixmap, QPainter, QBrush, QColor, QTransform, QCursor
 )
 from pathlib import Path
 
+### Constants ###
+
+# Stylesheet prepended to every article shown in the content view
+ARTICLE_STYLES = """
+<style>
+body {
+    max-width: 800px;
+    margin: auto;
+    padding: 5px;
+    font-family: 'Helvetica Neue', Helvetica, Arial, sans-serif;
+    font-size: 16px;
+    line-height: 1.6;
+    color: #333;
+    background-color: #f9f9f9;
+}
+h3 {
+    font-size: 18px;
+}
+p {
+    margin: 0 0 5px;
+}
+img {
+    max-width: 100%;
+    height: auto;
+    display: block;
+    margin: 5px 0;
+}
+a {
+    color: #1e90ff;
+    text-decoration: none;
+}
+a:hover {
+    text-decoration: underline;
+}
+blockquote {
+    margin: 5px 0;
+    padding: 5px 20px;
+    background-color: #f0f0f0;
+    border-left: 5px solid #ccc;
+}
+code {
+    font-family: monospace;
+    background-color: #f0f0f0;
+    padding: 2px 4px;
+    border-radius: 4px;
+}
+pre {
+    background-color: #f0f0f0;
+    padding: 10px;
+    overflow: auto;
+    border-radius: 4px;
+}
+</style>
+"""
+
+# Layout of an article in the content view; only the placeholders vary per article
+ARTICLE_TEMPLATE = """{styles}
+<h3>{title}</h3>
+{images}
+{content}
+{movie_info}
+{read_more}
+"""
+
+# Columns of the articles tree and the ones filled from OMDb
+ARTICLE_COLUMNS = ['Title', 'Date', 'Rating', 'Released', 'Genre', 'Director']
+(TITLE_COLUMN, DATE_COLUMN, RATING_COLUMN,
+ RELEASED_COLUMN, GENRE_COLUMN, DIRECTOR_COLUMN) = range(len(ARTICLE_COLUMNS))
+OMDB_COLUMN_ORDER = (RATING_COLUMN, RELEASED_COLUMN, GENRE_COLUMN, DIRECTOR_COLUMN)  # Matches get_movie_columns
+OMDB_COLUMNS = frozenset(OMDB_COLUMN_ORDER)
+
+# OMDb fields listed under an article, as (label, key in the OMDb record)
+MOVIE_DETAIL_FIELDS = (
+    ('Released', 'released'),
+    ('Plot', 'plot'),
+    ('Writer', 'writer'),
+    ('Actors', 'actors'),
+    ('Language', 'language'),
+    ('Country', 'country'),
+    ('Awards', 'awards'),
+    ('DVD Release', 'dvd'),
+    ('Box Office', 'boxoffice'),
+)
+
+# Patterns used to pull the movie title out of an RSS entry title
+TITLE_TAG_PREFIX_RE = re.compile(r'^\[.*?\]\s*')  # Leading "[Tag] " markers
+TITLE_SUFFIX_RE = re.compile(r'[\(\[]')  # Start of a trailing "(2020)" or "[...]" suffix
+
+# Platform and packaging facts; they cannot change while the app runs
+IS_MACOS = sys.platform == 'darwin'
+IS_WINDOWS = sys.platform == 'win32'
+IS_FROZEN = bool(getattr(sys, 'frozen', False))
+
 ### Helper Functions ###
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except AttributeError:
-        # When not frozen, use the directory of the script
-        base_path = os.path.dirname(os.path.abspath(__file__))
+    # PyInstaller creates a temp folder and stores path in _MEIPASS;
+    # when not frozen, use the directory of the script
+    base_path = getattr(sys, '_MEIPASS', None) or os.path.dirname(os.path.abspath(__file__))
     full_path = os.path.join(base_path, relative_path)
     if not os.path.exists(full_path):
         logging.error(f"Resource not found: {full_path}")
@@ -55,11 +144,11 @@ def resource_path(relative_path):
 
 def get_user_data_path(filename):
     """Get path to user data directory for the application."""
-    if getattr(sys, 'frozen', False):
+    if IS_FROZEN:
         # Running in a bundle
-        if sys.platform == "darwin":
+        if IS_MACOS:
             return os.path.join(Path.home(), "Library", "Application Support", "SmallRSSReader", filename)
-        elif sys.platform == "win32":
+        elif IS_WINDOWS:
             return os.path.join(os.getenv('APPDATA'), "SmallRSSReader", filename)
         else:
             return os.path.join(Path.home(), ".smallrssreader", filename)
@@ -69,66 +158,79 @@ def get_user_data_path(filename):
 
 ### Helper Classes ###
 
-class FetchFeedThread(QThread):
-    """Thread for fetching RSS feed data asynchronously."""
-    feed_fetched = pyqtSignal(object, object)  # Emits (url, feed)
+class LRUCache(OrderedDict):
+    """Dictionary that evicts its least recently used entries beyond maxsize."""
 
-    def __init__(self, url):
-        super().__init__()
-        self.url = url  # Ensure self.url is defined
+    def __init__(self, maxsize, *args, **kwargs):
+        self.maxsize = maxsize
+        super().__init__(*args, **kwargs)
 
-    def run(self):
-        logging.debug(f"Fetching feed: {self.url}")
-        try:
-            feed = feedparser.parse(self.url)
-            if feed.bozo and feed.bozo_exception:
-                raise feed.bozo_exception
-            self.feed_fetched.emit(self.url, feed)
-            logging.debug(f"Successfully fetched feed: {self.url}")
-        except Exception as e:
-            logging.error(f"Failed to fetch feed {self.url}: {e}")
-            self.feed_fetched.emit(self.url, None)
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
 
 class FetchMovieDataThread(QThread):
     """Thread for fetching movie data from OMDb API asynchronously."""
-    movie_data_fetched = pyqtSignal(int, dict)
+    movie_data_fetched = pyqtSignal(object, dict)  # entry, movie data
 
-    def __init__(self, entries, api_key, cache):
+    def __init__(self, entries, api_key, cache, cache_version=0):
         super().__init__()
         self.entries = entries
         self.api_key = api_key
         self.movie_data_cache = cache
+        self.cache_version = cache_version
 
     def run(self):
         if not self.api_key:
             logging.warning("OMDb API key not provided. Skipping movie data fetching.")
             return
-        for index, entry in enumerate(self.entries):
+        not_found = set()  # Titles OMDb had nothing for in this batch; failures are not cached
+        for entry in self.entries:
             title = entry.get('title', 'No Title')
             movie_title = self.extract_movie_title(title)
-            if movie_title in self.movie_data_cache:
-                movie_data = self.movie_data_cache[movie_title]
+            cache_key = self.cache_key(movie_title, self.cache_version)
+            if cache_key in self.movie_data_cache:
+                movie_data = self.movie_data_cache[cache_key]
                 logging.debug(f"Retrieved cached movie data for '{movie_title}'.")
+            elif cache_key in not_found:
+                movie_data = {}
             else:
                 movie_data = self.fetch_movie_data(movie_title)
                 if movie_data:
-                    self.movie_data_cache[movie_title] = movie_data
+                    self.movie_data_cache[cache_key] = movie_data
                     logging.debug(f"Fetched and cached movie data for '{movie_title}'.")
-            self.movie_data_fetched.emit(index, movie_data)
+                else:
+                    not_found.add(cache_key)
+            self.movie_data_fetched.emit(entry, movie_data)
 
     @staticmethod
+    def cache_key(movie_title, cache_version):
+        """Returns the movie cache key; version 0 keeps the bare title used by older caches."""
+        if cache_version:
+            return f"v{cache_version}:{movie_title}"
+        return movie_title
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
     def extract_movie_title(text):
-        """Extracts the movie title from the RSS entry title."""
-        text = re.sub(r'^\[.*?\]\s*', '', text)
+        """Extracts the movie title from the RSS entry title (memoized; it is pure)."""
+        text = TITLE_TAG_PREFIX_RE.sub('', text)
         parts = text.split('/')
 
         def is_mostly_latin(s):
-            try:
-                latin_count = sum('LATIN' in unicodedata.name(c) for c in s if c.isalpha())
-                total_count = sum(c.isalpha() for c in s)
-                return latin_count > total_count / 2 if total_count > 0 else False
-            except ValueError:
+            letters = [c for c in s if c.isalpha()]
+            if not letters:
                 return False
+            # ASCII letters are Latin without a name lookup; characters without a Unicode name count as non-Latin
+            latin_count = sum(c.isascii() or 'LATIN' in unicodedata.name(c, '') for c in letters)
+            return latin_count > len(letters) / 2
 
         for part in parts:
             part = part.strip()
@@ -138,7 +240,7 @@ class FetchMovieDataThread(QThread):
         else:
             english_title = text.strip()
 
-        english_title = re.split(r'[\(\[]', english_title)[0].strip()
+        english_title = TITLE_SUFFIX_RE.split(english_title, 1)[0].strip()
         return english_title
 
     def fetch_movie_data(self, movie_title):
@@ -153,10 +255,82 @@ class FetchMovieDataThread(QThread):
             logging.error(f"Failed to fetch movie data for '{movie_title}': {e}")
             return {}
 
+class FileWriterThread(QThread):
+    """Thread for writing data files to disk without blocking the UI."""
+
+    def __init__(self):
+        super().__init__()
+        self.queue = queue.Queue()
+
+    def write(self, path, payload):
+        """Queues a payload for path; non-string data is serialized on this thread, so it must not change afterwards."""
+        self.queue.put((path, payload))
+
+    @staticmethod
+    def serialize(data):
+        """Serializes data compactly as JSON."""
+        # Non-ASCII titles stay as UTF-8 instead of six-byte \u escapes, shrinking the files
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+    def stop(self):
+        """Writes all queued payloads and stops the thread."""
+        self.queue.put(None)
+        self.wait()
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            pending = {}
+            stopping = False
+            # Coalesce queued writes so only the latest payload per file hits the disk
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                path, payload = item
+                pending[path] = payload
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            for path, payload in pending.items():
+                try:
+                    if not isinstance(payload, str):
+                        payload = self.serialize(payload)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    # Write to a temporary file and swap it in so a crash never leaves a truncated file
+                    tmp_path = path + '.tmp'
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        f.write(payload)
+                    os.replace(tmp_path, path)
+                    logging.debug(f"Wrote {path}")
+                except Exception as e:
+                    logging.error(f"Failed to write {path}: {e}")
+            if stopping:
+                return
+
 class ArticleTreeWidgetItem(QTreeWidgetItem):
     """Custom QTreeWidgetItem to handle sorting of different data types."""
+    # Kept as plain Python attributes; storing the entry dict with setData copies it into a QVariant
+    entry = None
+    article_id = None
+    feed_url = None  # Feed the article belongs to; the tree can still show another feed's rows
+    date_value = ()  # Date key tuple; the empty tuple sorts undated articles first
+    date_key = None
+    is_unread = False  # Whether the unread icon is currently shown
+    # OMDb sort keys; articles without movie data sort after rated ones and before dated ones
+    rating_value = (1, 0.0)
+    release_value = (0, datetime.datetime.min)
+
     def __lt__(self, other):
         column = self.treeWidget().sortColumn()
+        if column == DATE_COLUMN:
+            # Compare the cached dates without converting them back from QVariant
+            return self.date_value < other.date_value
+        if column == RATING_COLUMN:
+            return self.rating_value < other.rating_value
+        if column == RELEASED_COLUMN:
+            return self.release_value < other.release_value
         data1 = self.data(column, Qt.UserRole)
         data2 = other.data(column, Qt.UserRole)
 
@@ -273,9 +447,7 @@ class SettingsDialog(QDialog):
 
         # **Add Global Notifications Checkbox**
         self.global_notifications_checkbox = QCheckBox("Enable Notifications", self)
-        settings = QSettings('rocker', 'SmallRSSReader')
-        global_notifications = settings.value('notifications_enabled', True, type=bool)
-        self.global_notifications_checkbox.setChecked(global_notifications)
+        self.global_notifications_checkbox.setChecked(self.parent.global_notifications_enabled)
         layout.addRow("Global Notifications:", self.global_notifications_checkbox)
 
         self.buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
@@ -285,9 +457,7 @@ class SettingsDialog(QDialog):
     
         # Add Tray Icon Checkbox
         self.tray_icon_checkbox = QCheckBox("Enable Tray Icon", self)
-        settings = QSettings('rocker', 'SmallRSSReader')
-        tray_icon_enabled = settings.value('tray_icon_enabled', True, type=bool)
-        self.tray_icon_checkbox.setChecked(tray_icon_enabled)
+        self.tray_icon_checkbox.setChecked(self.parent.tray_icon_enabled)
         layout.addRow("Tray Icon:", self.tray_icon_checkbox)
 
     def update_api_key_notice(self):
@@ -303,6 +473,7 @@ class SettingsDialog(QDialog):
         refresh_interval = self.refresh_interval_input.value()
         font_name = self.font_name_combo.currentFont().family()
         font_size = self.font_size_spin.value()
+        api_key_changed = api_key != self.parent.api_key
         self.parent.api_key = api_key
         self.parent.refresh_interval = refresh_interval
         self.parent.current_font_size = font_size
@@ -311,12 +482,16 @@ class SettingsDialog(QDialog):
         # Save Global Notifications Setting
         notifications_enabled = self.global_notifications_checkbox.isChecked()
 
-        settings = QSettings('rocker', 'SmallRSSReader')
+        settings = self.parent.settings
         settings.setValue('omdb_api_key', api_key)
         settings.setValue('refresh_interval', refresh_interval)
         settings.setValue('font_name', font_name)
         settings.setValue('font_size', font_size)
         settings.setValue('notifications_enabled', notifications_enabled)
+        self.parent.global_notifications_enabled = notifications_enabled
+        if api_key_changed:
+            # Results fetched with the old key may be missing or wrong; make them unreachable
+            self.parent.invalidate_movie_cache(settings)
 
         self.parent.update_refresh_timer()
         self.parent.apply_font_size()
@@ -327,27 +502,15 @@ class SettingsDialog(QDialog):
         settings.setValue('tray_icon_enabled', tray_icon_enabled)
         self.parent.tray_icon_enabled = tray_icon_enabled  # Update the parent variable
 
-        # Save Tray Icon Setting
-        tray_icon_enabled = self.tray_icon_checkbox.isChecked()
-        settings.setValue('tray_icon_enabled', tray_icon_enabled)
-        self.parent.tray_icon_enabled = tray_icon_enabled  # Update the parent variable
-
         # Update the tray icon visibility
         if tray_icon_enabled:
             if self.parent.tray_icon is None:
                 self.parent.init_tray_icon()
             else:
-                # Set the normal tray icon
-                tray_icon_pixmap = QPixmap(resource_path('icons/rss_tray_icon.png'))
-                self.parent.tray_icon.setIcon(QIcon(tray_icon_pixmap))
-                self.parent.tray_icon.show()
+                self.parent.set_tray_icon_shown(True)
         else:
             if self.parent.tray_icon is not None:
-                # Set a transparent icon and hide it
-                transparent_pixmap = QPixmap(1, 1)
-                transparent_pixmap.fill(Qt.transparent)
-                self.parent.tray_icon.setIcon(QIcon(transparent_pixmap))
-                self.parent.tray_icon.hide()
+                self.parent.set_tray_icon_shown(False)
 
     def accept(self):
         """Override accept to save settings before closing the dialog."""
@@ -385,6 +548,16 @@ class RSSReader(QMainWindow):
     REFRESH_SELECTED_ICON = QStyle.SP_BrowserReload
     REFRESH_ALL_ICON = QStyle.SP_DialogResetButton  # Use a different standard icon
 
+    # Maximum number of movies kept in the OMDb movie data cache
+    MOVIE_CACHE_SIZE = 2000
+
+    # Rendered article pages kept in memory, and how many visible rows are pre-rendered when idle
+    ARTICLE_HTML_CACHE_SIZE = 200
+    PREFETCH_LIMIT = 20
+
+    # Feeds whose article rows are kept detached for instant switching back
+    PARKED_FEEDS_SIZE = 10
+
     # Define a new signal for notifications
     notify_signal = pyqtSignal(str, str, str, str)  # title, subtitle, message, link
 
@@ -394,52 +567,117 @@ class RSSReader(QMainWindow):
         self.resize(1200, 800)
         self.initialize_variables()
         self.init_ui()
+        self.active_feed_threads = 0
         self.load_group_names()
+        # Loads every store once, builds the tray icon and schedules the first refresh
         self.load_settings()
-        self.load_read_articles()
-        self.load_feeds()
-        # Start refresh after event loop starts to prevent blocking UI
-        QTimer.singleShot(0, self.force_refresh_all_feeds)
-        self.select_first_feed()
-        self.active_feed_threads = 0 
 
-        # Initialize QSystemTrayIcon for native notifications
-        self.init_tray_icon()
         # Connect the notification signal to the slot
         self.notify_signal.connect(self.show_notification)
 
     def initialize_variables(self):
         """Initializes all variables."""
         self.feeds = []
+        self.feeds_by_url = {}  # Mapping from feed URL to feed data
         self.current_entries = []
         self.api_key = ''
+        self.movie_cache_version = 0  # Part of every movie cache key; bumped to invalidate the cache
         self.refresh_interval = 60  # Default refresh interval in minutes
-        self.movie_data_cache = {}
+        self.movie_data_cache = LRUCache(self.MOVIE_CACHE_SIZE)
+        self.article_html_cache = LRUCache(self.ARTICLE_HTML_CACHE_SIZE)  # Rendered HTML per article ID
+        self.shown_article_html = None  # HTML currently loaded in the content view
         self.read_articles = set()
         self.threads = []
         self.article_id_to_item = {}  # Mapping from article_id to QTreeWidgetItem
+        self.displayed_feed_url = None  # Feed whose articles are in the articles tree
+        self.parked_article_items = LRUCache(self.PARKED_FEEDS_SIZE)  # Feed URL -> detached article_id_to_item
+        self.feed_items_by_url = {}  # Mapping from feed URL to its item in the feeds list
+        self.group_items = {}  # Mapping from group name to its item in the feeds list
+        self.pending_group_icons = False  # A deferred group icon pass is scheduled
+        self.dirty_feed_icons = set()  # Feed URLs whose new updates icon must be repainted
+        self.feed_icon_flush_scheduled = False
+        self.feed_domains = {}  # Mapping from feed URL to its parsed domain
+        self.feeds_with_new_icon = set()  # Feeds currently showing the new updates icon
         self.group_name_mapping = {}  # Mapping from domain to custom group name
         self.group_settings = {}  # Group-specific settings
+        self.omdb_enabled_cache = {}  # Memoized OMDb setting per feed URL
+        self.movie_fetch_urls = set()  # Feeds with a movie data fetch in flight
+        self.movie_data_misses = set()  # Article IDs OMDb returned nothing for; kept out of feeds.json so they are retried later
+        self.fetching_urls = set()  # Feeds with a fetch thread in flight
+        self.entry_hashes_by_url = {}  # Hash of the article IDs last fetched per feed
+        self.article_ids_by_url = {}  # Set of stored article IDs per feed, see get_feed_article_ids
+        self.unread_counts = {}  # Number of unread articles per feed URL
+        self.tray_icon = None
+        self.tray_tooltip_update_scheduled = False
+        self.tray_image_icon = None  # Tray icon image, loaded on first use
+        self.transparent_icon = None  # Blank tray icon used while the tray icon is disabled
         self.is_refreshing = False
         self.is_quitting = False  # Flag to indicate if the app is quitting
         self.refresh_icon_angle = 0
         self.icon_rotation_timer = QTimer()
         self.icon_rotation_timer.timeout.connect(self.rotate_refresh_icon)
         self.auto_refresh_timer = QTimer()
+        self.search_timer = QTimer()  # Debounces the search filter while typing
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.apply_search_filter)
+        self.read_articles_save_timer = QTimer()  # Coalesces saves while reading articles
+        self.read_articles_save_timer.setSingleShot(True)
+        self.read_articles_save_timer.setInterval(1000)
+        self.read_articles_save_timer.timeout.connect(self.save_read_articles)
+        self.movie_cache_save_timer = QTimer()  # Coalesces saves while movie data streams in
+        self.movie_cache_save_timer.setSingleShot(True)
+        self.movie_cache_save_timer.setInterval(2000)
+        self.movie_cache_save_timer.timeout.connect(self.save_movie_data_cache)
+        self.feeds_save_timer = QTimer()  # Coalesces feeds.json writes from resizes and refreshes
+        self.feeds_save_timer.setSingleShot(True)
+        self.feeds_save_timer.setInterval(500)
+        self.feeds_save_timer.timeout.connect(self.save_feeds)
+        self.group_settings_save_timer = QTimer()  # Coalesces group_settings.json writes from dialog changes and renames
+        self.group_settings_save_timer.setSingleShot(True)
+        self.group_settings_save_timer.setInterval(500)
+        self.group_settings_save_timer.timeout.connect(self.save_group_settings)
+        self.prefetch_timer = QTimer()  # Pre-renders visible articles once scrolling settles
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(400)
+        self.prefetch_timer.timeout.connect(self.prefetch_visible_articles)
         self.force_refresh_icon_pixmap = None  # To store the icon pixmap
+        self.refresh_icon_frames = []  # Pre-rotated refresh icons for the spinner
+        self.unread_icon = None  # Blue dot icon, drawn once on first use
+        self.empty_icon = QIcon()  # Shared empty icon for read items
+        self.standard_icons = {}  # Style icons by QStyle.StandardPixmap
         self.column_widths = {}  # Stores column widths per feed
+        self.restoring_columns = False  # Set while populate_articles applies a feed's column layout
+
+        # **Data File Paths**: resolved once; they do not change while the app runs
+        self.feeds_path = get_user_data_path('feeds.json')
+        self.read_articles_path = get_user_data_path('read_articles.json')
+        self.group_settings_path = get_user_data_path('group_settings.json')
+        self.movie_cache_path = get_user_data_path('movie_data_cache.json')
+
+        # **Start the Background File Writer**
+        self.file_writer = FileWriterThread()
+        self.file_writer.start()
+        QApplication.instance().aboutToQuit.connect(self.file_writer.stop)
 
         # **Font Variables**
         self.default_font_size = 14  # Default font size
         self.default_font = QFont("Arial", self.default_font_size)
-        settings = QSettings('rocker', 'SmallRSSReader')
-        self.current_font_size = settings.value('font_size', self.default_font_size, type=int)
-        font_name = settings.value('font_name', self.default_font.family(), type=str)
+        self.settings = QSettings('rocker', 'SmallRSSReader')  # Shared settings store
+        self.current_font_size = self.settings.value('font_size', self.default_font_size, type=int)
+        font_name = self.settings.value('font_name', self.default_font.family(), type=str)
         self.default_font = QFont(font_name, self.current_font_size)
+        # Read on every new article, so keep it in memory; the settings dialog updates it
+        self.global_notifications_enabled = self.settings.value('notifications_enabled', True, type=bool)
 
         # **Initialize Thread Pool**
         self.thread_pool = QThreadPool.globalInstance()
         self.thread_pool.setMaxThreadCount(8)  # Limit to 8 concurrent threads
+        # One signal carrier per result handler, shared by every feed fetch
+        self.feed_worker = Worker()
+        self.feed_worker.feed_fetched.connect(self.on_feed_fetched)
+        self.force_refresh_worker = Worker()
+        self.force_refresh_worker.feed_fetched.connect(self.on_feed_fetched_force_refresh)
 
         # **Load Movie Icon**
         movie_icon_path = resource_path('icons/movie_icon.png')
@@ -464,14 +702,14 @@ class RSSReader(QMainWindow):
 
     def save_font_size(self):
         """Saves the current font size to settings."""
-        settings = QSettings('rocker', 'SmallRSSReader')
-        settings.setValue('font_size', self.current_font_size)
+        self.settings.setValue('font_size', self.current_font_size)
 
     def apply_font_size(self):
         """Applies the current font name and size to relevant widgets."""
         font = QFont(self.default_font.family(), self.current_font_size)
         self.articles_tree.setFont(font)
-        self.content_view.setFont(font)
+        if self.content_view is not None:
+            self.content_view.setFont(font)
 
         # Optionally, apply to other widgets like feed list, toolbar, etc.
         # self.feeds_list.setFont(font)
@@ -531,26 +769,22 @@ class RSSReader(QMainWindow):
 
 
 
+    def are_notifications_enabled(self, feed_url):
+        """Returns whether new articles of a feed should raise notifications."""
+        if not self.global_notifications_enabled:
+            return False
+        group_name = self.get_group_name_for_feed(feed_url)
+        return self.group_settings.get(group_name, {}).get('notifications_enabled', True)
+
     def send_notification(self, feed_title, entry):
         """Emit a signal to show a macOS notification for a new article."""
-        group_name = self.get_group_name_for_feed(entry.get('link', ''))
-        group_settings = self.group_settings.get(group_name, {'notifications_enabled': True})
-        notifications_enabled = group_settings.get('notifications_enabled', True)
-
-        # Check global notification setting
-        settings = QSettings('rocker', 'SmallRSSReader')
-        global_notifications = settings.value('notifications_enabled', True, type=bool)
-
-        if global_notifications and notifications_enabled:
-            title = f"New Article in {feed_title}"
-            subtitle = entry.get('title', 'No Title')
-            message = entry.get('summary', 'No summary available.')
-            link = entry.get('link', '')
-            # Emit the notification signal
-            self.notify_signal.emit(title, subtitle, message, link)
-            logging.info(f"Sent notification for new article: {entry.get('title', 'No Title')}")
-        else:
-            logging.debug(f"Notification for feed '{feed_title}' is disabled.")
+        title = f"New Article in {feed_title}"
+        subtitle = entry.get('title', 'No Title')
+        message = entry.get('summary', 'No summary available.')
+        link = entry.get('link', '')
+        # Emit the notification signal
+        self.notify_signal.emit(title, subtitle, message, link)
+        logging.info(f"Sent notification for new article: {entry.get('title', 'No Title')}")
 
     def init_ui(self):
         """Initializes the main UI components."""
@@ -650,7 +884,14 @@ class RSSReader(QMainWindow):
         articles_layout.setSpacing(2)
 
         self.articles_tree = QTreeWidget()
-        self.articles_tree.setHeaderLabels(['Title', 'Date', 'Rating', 'Released', 'Genre', 'Director'])
+        self.articles_tree.setHeaderLabels(ARTICLE_COLUMNS)
+
+        # **Flat List Tuning**: rows share one height and never nest, so Qt can skip per-row layout
+        self.articles_tree.setUniformRowHeights(True)
+        self.articles_tree.setRootIsDecorated(False)
+        self.articles_tree.setItemsExpandable(False)
+        self.articles_tree.setAnimated(False)
+        self.articles_tree.setVerticalScrollMode(QAbstractItemView.ScrollPerItem)
 
         # disable toolip mouse hovering on articles title
         
@@ -676,6 +917,9 @@ class RSSReader(QMainWindow):
 
         # Existing Connections
         self.articles_tree.itemSelectionChanged.connect(self.display_content)
+        # Through a no-argument slot: connected directly, valueChanged(int) would call QTimer.start(msec)
+        self.articles_tree.itemSelectionChanged.connect(self.schedule_prefetch)
+        self.articles_tree.verticalScrollBar().valueChanged.connect(self.schedule_prefetch)
 
         # Additional Connections
         self.articles_tree.itemClicked.connect(self.display_content)
@@ -699,21 +943,35 @@ class RSSReader(QMainWindow):
     def init_content_panel(self):
         """Initializes the content panel."""
         self.content_panel = QWidget()
-        content_layout = QVBoxLayout(self.content_panel)
-        content_layout.setContentsMargins(2, 2, 2, 2)
-        content_layout.setSpacing(2)
+        self.content_layout = QVBoxLayout(self.content_panel)
+        self.content_layout.setContentsMargins(2, 2, 2, 2)
+        self.content_layout.setSpacing(2)
 
-        self.content_view = QWebEngineView()
-        self.content_view.settings().setAttribute(
-            QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
-        self.content_view.setPage(WebEnginePage(self.content_view))
-        content_layout.addWidget(self.content_view)
+        # The web view starts the Chromium engine, so it is only created for the first article
+        self.content_view = None
+        self.content_placeholder = QWidget()
+        self.content_layout.addWidget(self.content_placeholder)
 
         self.main_splitter.addWidget(self.content_panel)
 
+    def ensure_content_view(self):
+        """Creates the web view on first use, replacing the placeholder."""
+        if self.content_view is None:
+            self.content_view = QWebEngineView()
+            self.content_view.settings().setAttribute(
+                QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
+            self.content_view.setPage(WebEnginePage(self.content_view))
+            self.content_view.setFont(QFont(self.default_font.family(), self.current_font_size))
+            self.content_layout.replaceWidget(self.content_placeholder, self.content_view)
+            self.content_placeholder.deleteLater()
+            self.content_placeholder = None
+            logging.debug("Created the article content view.")
+        return self.content_view
+
     def init_menu(self):
         """Initializes the menu bar."""
-        menu = self.menuBar()
+        self.menu_bar = self.menuBar()  # Kept so toggles and saves skip the lookup
+        menu = self.menu_bar
 
         # File menu
         file_menu = menu.addMenu("File")
@@ -727,23 +985,23 @@ class RSSReader(QMainWindow):
         font_size_menu = view_menu.addMenu("Font Size")
 
         increase_font_action = QAction("Increase Font Size", self)
-        increase_font_action.setShortcut("Cmd++" if sys.platform == 'darwin' else "Ctrl++")
+        increase_font_action.setShortcut("Cmd++" if IS_MACOS else "Ctrl++")
         increase_font_action.triggered.connect(self.increase_font_size)
         font_size_menu.addAction(increase_font_action)
 
         decrease_font_action = QAction("Decrease Font Size", self)
-        decrease_font_action.setShortcut("Cmd+-" if sys.platform == 'darwin' else "Ctrl+-")
+        decrease_font_action.setShortcut("Cmd+-" if IS_MACOS else "Ctrl+-")
         decrease_font_action.triggered.connect(self.decrease_font_size)
         font_size_menu.addAction(decrease_font_action)
 
         reset_font_action = QAction("Reset Font Size", self)
-        reset_font_action.setShortcut("Cmd+0" if sys.platform == 'darwin' else "Ctrl+0")
+        reset_font_action.setShortcut("Cmd+0" if IS_MACOS else "Ctrl+0")
         reset_font_action.triggered.connect(self.reset_font_size)
         font_size_menu.addAction(reset_font_action)
 
         # **Add Quit Action with Cmd+Q Shortcut**
         quit_action = QAction("Quit", self)
-        quit_action.setShortcut("Cmd+Q" if sys.platform == 'darwin' else "Ctrl+Q")
+        quit_action.setShortcut("Cmd+Q" if IS_MACOS else "Ctrl+Q")
         quit_action.triggered.connect(self.quit_app)
         file_menu.addAction(quit_action)
 
@@ -757,7 +1015,7 @@ class RSSReader(QMainWindow):
             column (int): The column that was double-clicked.
         """
         # Retrieve the entry associated with the item
-        entry = item.data(0, Qt.UserRole)
+        entry = item.entry
         if not entry:
             QMessageBox.warning(self, "No Entry Data", "No data available for the selected article.")
             return
@@ -792,7 +1050,7 @@ class RSSReader(QMainWindow):
         file_menu.addAction(settings_action)
 
         exit_action = QAction("Exit", self)
-        exit_action.setShortcut('Ctrl+Q' if sys.platform != 'darwin' else 'Cmd+Q')
+        exit_action.setShortcut('Cmd+Q' if IS_MACOS else 'Ctrl+Q')
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
@@ -834,16 +1092,24 @@ class RSSReader(QMainWindow):
         self.add_mark_feed_read_button()
         self.add_search_widget()
 
+    def standard_icon(self, standard_pixmap):
+        """Returns a style icon, resolving each one through the theme only once."""
+        icon = self.standard_icons.get(standard_pixmap)
+        if icon is None:
+            icon = self.style().standardIcon(standard_pixmap)
+            self.standard_icons[standard_pixmap] = icon
+        return icon
+
     def add_mark_feed_read_button(self):
         """Adds the 'Mark Feed as Read' button to the toolbar."""
-        mark_read_icon = self.style().standardIcon(QStyle.SP_DialogApplyButton)
+        mark_read_icon = self.standard_icon(QStyle.SP_DialogApplyButton)
         mark_read_action = QAction(mark_read_icon, "Mark Feed as Read", self)
         mark_read_action.triggered.connect(self.mark_feed_as_read)
         self.toolbar.addAction(mark_read_action)
         
     def add_new_feed_button(self):
         """Adds the 'New Feed' button to the toolbar."""
-        new_feed_icon = self.style().standardIcon(QStyle.SP_FileDialogNewFolder)
+        new_feed_icon = self.standard_icon(QStyle.SP_FileDialogNewFolder)
         self.new_feed_button = QPushButton("New Feed")
         self.new_feed_button.setIcon(new_feed_icon)
         self.new_feed_button.setStyleSheet("""
@@ -868,21 +1134,30 @@ class RSSReader(QMainWindow):
     def add_refresh_buttons(self):
         """Adds the refresh buttons to the toolbar."""
         # Refresh Selected Feed Button
-        refresh_selected_icon = self.style().standardIcon(self.REFRESH_SELECTED_ICON)
+        refresh_selected_icon = self.standard_icon(self.REFRESH_SELECTED_ICON)
         refresh_action = QAction(refresh_selected_icon, "Refresh Selected Feed", self)
         refresh_action.triggered.connect(self.refresh_feed)
         self.toolbar.addAction(refresh_action)
 
         # Refresh All Feeds Button
-        force_refresh_icon = self.style().standardIcon(self.REFRESH_ALL_ICON)
+        force_refresh_icon = self.standard_icon(self.REFRESH_ALL_ICON)
         self.force_refresh_action = QAction(force_refresh_icon, "Refresh All Feeds", self)
         self.force_refresh_action.triggered.connect(self.force_refresh_all_feeds)
         self.toolbar.addAction(self.force_refresh_action)
         self.force_refresh_icon_pixmap = force_refresh_icon.pixmap(24, 24)
+        self.refresh_icon_frames = self.build_refresh_icon_frames(self.force_refresh_icon_pixmap)
+
+    def build_refresh_icon_frames(self, pixmap, step=30):
+        """Renders the rotated refresh icons once so the spinner only swaps icons."""
+        frames = []
+        for angle in range(0, 360, step):
+            transform = QTransform().rotate(angle)
+            frames.append(QIcon(pixmap.transformed(transform, Qt.SmoothTransformation)))
+        return frames
 
     def add_mark_unread_button(self):
         """Adds the 'Mark Feed Unread' button to the toolbar."""
-        mark_unread_icon = self.style().standardIcon(QStyle.SP_DialogCancelButton)
+        mark_unread_icon = self.standard_icon(QStyle.SP_DialogCancelButton)
         mark_unread_action = QAction(mark_unread_icon, "Mark Feed Unread", self)
         mark_unread_action.triggered.connect(self.mark_feed_unread)
         self.toolbar.addAction(mark_unread_action)
@@ -900,7 +1175,7 @@ class RSSReader(QMainWindow):
         # **Handle Esc Key to Clear Input**
         self.search_input.installEventFilter(self)
 
-        self.search_input.textChanged.connect(self.filter_articles)
+        self.search_input.textChanged.connect(self.schedule_search_filter)
         search_layout = QHBoxLayout()
         search_layout.setContentsMargins(0, 0, 0, 0)
         search_layout.setSpacing(0)  # Remove spacing
@@ -934,7 +1209,7 @@ class RSSReader(QMainWindow):
 
     def load_settings(self):
         """Loads application settings."""
-        settings = QSettings('rocker', 'SmallRSSReader')
+        settings = self.settings
         self.restore_geometry_and_state(settings)
         self.load_api_key_and_refresh_interval(settings)
         self.load_ui_visibility_settings(settings)
@@ -981,11 +1256,11 @@ class RSSReader(QMainWindow):
 
     def load_api_key_and_refresh_interval(self, settings):
         """Loads the API key and refresh interval."""
-        self.api_key = settings.value('omdb_api_key', '')
-        refresh_interval = settings.value('refresh_interval', 60)
+        self.api_key = settings.value('omdb_api_key', '', type=str)
+        self.movie_cache_version = settings.value('movie_cache_version', 0, type=int)
         try:
-            self.refresh_interval = int(refresh_interval)
-        except ValueError:
+            self.refresh_interval = settings.value('refresh_interval', 60, type=int)
+        except (TypeError, ValueError):
             self.refresh_interval = 60
         self.update_refresh_timer()
 
@@ -1000,39 +1275,40 @@ class RSSReader(QMainWindow):
         self.toggle_toolbar_action.setChecked(toolbar_visible)
 
         menubar_visible = settings.value('menubar_visible', True, type=bool)
-        self.menuBar().setVisible(menubar_visible)
+        self.menu_bar.setVisible(menubar_visible)
         self.toggle_menubar_action.setChecked(menubar_visible)
 
     def load_movie_data_cache(self):
         """Loads the movie data cache."""
-        cache_path = get_user_data_path('movie_data_cache.json')
+        cache_path = self.movie_cache_path
         if os.path.exists(cache_path):
             try:
-                with open(cache_path, 'r') as f:
-                    self.movie_data_cache = json.load(f)
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    self.movie_data_cache = LRUCache(self.MOVIE_CACHE_SIZE, json.load(f))
                     logging.info(f"Loaded movie data cache with {len(self.movie_data_cache)} entries.")
             except json.JSONDecodeError:
                 QMessageBox.critical(self, "Load Error", "Failed to parse movie_data_cache.json. The file may be corrupted.")
                 logging.error("Failed to parse movie_data_cache.json.")
-                self.movie_data_cache = {}
+                self.movie_data_cache = LRUCache(self.MOVIE_CACHE_SIZE)
             except Exception as e:
                 QMessageBox.critical(self, "Load Error", f"An unexpected error occurred while loading movie data cache: {e}")
                 logging.error(f"Unexpected error while loading movie data cache: {e}")
-                self.movie_data_cache = {}
+                self.movie_data_cache = LRUCache(self.MOVIE_CACHE_SIZE)
         else:
             # Initialize with an empty cache
-            self.movie_data_cache = {}
+            self.movie_data_cache = LRUCache(self.MOVIE_CACHE_SIZE)
             self.save_movie_data_cache()
             logging.info("Created empty movie_data_cache.json.")
 
     def load_group_settings(self, settings):
         """Loads group-specific settings from group_settings.json."""
-        group_settings_path = get_user_data_path('group_settings.json')
+        group_settings_path = self.group_settings_path
         if os.path.exists(group_settings_path):
             try:
-                with open(group_settings_path, 'r') as f:
+                with open(group_settings_path, 'r', encoding='utf-8') as f:
                     group_settings = json.load(f)
                     self.group_settings = group_settings
+                    self.omdb_enabled_cache.clear()
                     logging.info(f"Loaded group settings with {len(self.group_settings)} groups.")
             except json.JSONDecodeError:
                 QMessageBox.critical(self, "Load Error", "Failed to parse group_settings.json. The file may be corrupted.")
@@ -1045,15 +1321,15 @@ class RSSReader(QMainWindow):
         else:
             # Initialize with an empty dictionary
             self.group_settings = {}
-            self.save_group_settings(settings)
+            self.save_group_settings()
             logging.info("Created empty group_settings.json.")
 
     def load_read_articles(self):
         """Loads the set of read articles from read_articles.json."""
         try:
-            read_articles_path = get_user_data_path('read_articles.json')
+            read_articles_path = self.read_articles_path
             if os.path.exists(read_articles_path):
-                with open(read_articles_path, 'r') as f:
+                with open(read_articles_path, 'r', encoding='utf-8') as f:
                     read_articles = json.load(f)
                     self.read_articles = set(read_articles)
                     logging.info(f"Loaded {len(self.read_articles)} read articles.")
@@ -1081,22 +1357,42 @@ class RSSReader(QMainWindow):
     def closeEvent(self, event):
         """Handles the window close event."""
         if self.is_quitting:
-            # Perform cleanup before quitting
+            # Perform cleanup before quitting; pending debounced saves are covered below
+            self.read_articles_save_timer.stop()
+            self.movie_cache_save_timer.stop()
+            self.feeds_save_timer.stop()
+            self.group_settings_save_timer.stop()
             self.save_feeds()
-            settings = QSettings('rocker', 'SmallRSSReader')
-            self.save_geometry_and_state(settings)
-            self.save_ui_visibility_settings(settings)
+            self.save_geometry_and_state(self.settings)
+            self.save_ui_visibility_settings(self.settings)
             self.save_movie_data_cache()
             self.save_group_settings()
             self.save_read_articles()
             self.save_font_size()
+            # Flush all the values above to the settings store in one go
+            self.settings.sync()
 
-            # Gracefully terminate all threads
+            # Get the window and tray icon out of the way; terminating threads below can take a while
+            self.hide()
+            if self.tray_icon is not None:
+                self.tray_icon.hide()
+
+            # Gracefully terminate all threads; signal them all first so they wind down together
+            # while the background writer is already flushing the files queued above
             for thread in self.threads:
                 thread.terminate()
+            for thread in self.threads:
                 thread.wait()
+            # Drop feed fetches that have not started yet and let the running ones finish,
+            # so none of them emits on the Worker objects after they are destroyed
+            self.thread_pool.clear()
+            if not self.thread_pool.waitForDone(5000):
+                logging.warning("Some feed fetches were still running at exit.")
             logging.info("All threads terminated.")
 
+            # Wait for the queued file writes to reach the disk
+            self.file_writer.stop()
+
             # Accept the event to allow the application to quit
             event.accept()
         else:
@@ -1118,33 +1414,24 @@ class RSSReader(QMainWindow):
             QMessageBox.information(self, "No Articles", "The selected feed has no articles.")
             return
 
-        for entry in feed_entries:
-            article_id = self.get_article_id(entry)
-            if article_id not in self.read_articles:
-                self.read_articles.add(article_id)
+        self.read_articles |= self.get_feed_article_ids(current_feed)
+        self.unread_counts[feed_url] = 0
+        self.update_tray_tooltip()
 
-        # Save read articles
-        self.save_read_articles()
+        # Save read articles; the timer coalesces repeated clicks into one write
+        self.read_articles_save_timer.start()
 
-        # Update the UI to reflect the changes
-        self.populate_articles()
+        # Update the icons in place instead of repopulating the tree
+        self.refresh_article_icons()
         self.statusBar().showMessage(f"Marked all articles in '{current_feed['title']}' as read.")
         logging.info(f"Marked all articles in feed '{current_feed['title']}' as read.")
         
     def init_tray_icon(self):
         """Initializes the system tray icon."""
         self.tray_icon = QSystemTrayIcon(self)
+        self.set_tray_icon_shown(self.tray_icon_enabled)
         if self.tray_icon_enabled:
-            tray_icon_pixmap = QPixmap(resource_path('icons/rss_tray_icon.png'))  # Ensure you have this icon
-            self.tray_icon.setIcon(QIcon(tray_icon_pixmap))
-            self.tray_icon.setToolTip("Small RSS Reader")
-            self.tray_icon.show()
-        else:
-            # Set a transparent icon to hide the tray icon
-            transparent_pixmap = QPixmap(1, 1)
-            transparent_pixmap.fill(Qt.transparent)
-            self.tray_icon.setIcon(QIcon(transparent_pixmap))
-            self.tray_icon.hide()
+            self.update_tray_tooltip()
 
         # Create tray menu (only for right-click)
         self.tray_menu = QMenu()
@@ -1167,6 +1454,22 @@ class RSSReader(QMainWindow):
         self.tray_icon.activated.connect(self.on_tray_icon_activated)
         self.tray_icon.show()
 
+    def set_tray_icon_shown(self, shown):
+        """Shows the tray icon, or blanks and hides it; both icons are loaded once and reused."""
+        if shown:
+            if self.tray_image_icon is None:
+                self.tray_image_icon = QIcon(QPixmap(resource_path('icons/rss_tray_icon.png')))
+            self.tray_icon.setIcon(self.tray_image_icon)
+            self.tray_icon.show()
+        else:
+            if self.transparent_icon is None:
+                # A transparent icon keeps the tray slot from flashing the old image
+                transparent_pixmap = QPixmap(1, 1)
+                transparent_pixmap.fill(Qt.transparent)
+                self.transparent_icon = QIcon(transparent_pixmap)
+            self.tray_icon.setIcon(self.transparent_icon)
+            self.tray_icon.hide()
+
     def on_tray_icon_activated(self, reason):
         """Handles tray icon activation (left-click to toggle visibility, right-click for menu)."""
         if self.tray_icon is None:
@@ -1204,6 +1507,8 @@ class RSSReader(QMainWindow):
 
     def save_column_widths(self, logical_index, old_size, new_size):
         """Saves the column widths for the current feed and applies them to the entire group."""
+        if self.restoring_columns:
+            return  # Programmatic resize while showing a feed, not a user drag
         current_feed = self.get_current_feed()
         if not current_feed:
             return
@@ -1219,20 +1524,21 @@ class RSSReader(QMainWindow):
         # Save the new width for the current feed
         self.column_widths[feed_url][logical_index] = new_size
 
-        # Update the widths for all feeds in the same group
-        group_name = self.get_group_name_for_feed(feed_url)
-        for feed in self.feeds:
-            if self.get_group_name_for_feed(feed['url']) == group_name:
-                if feed['url'] not in self.column_widths:
-                    self.column_widths[feed['url']] = [100] * self.articles_tree.header().count()  # Default widths
+        # Update the widths for all feeds in the same group; the group item holds exactly those feeds
+        feed_item = self.feed_items_by_url.get(feed_url)
+        group_item = feed_item.parent() if feed_item is not None else None
+        group_feed_urls = [group_item.child(i).data(0, Qt.UserRole) for i in range(group_item.childCount())] if group_item else []
+        for url in group_feed_urls:
+            if url not in self.column_widths:
+                self.column_widths[url] = [100] * self.articles_tree.header().count()  # Default widths
 
-                # Ensure the list has enough elements
-                while len(self.column_widths[feed['url']]) <= logical_index:
-                    self.column_widths[feed['url']].append(0)
+            # Ensure the list has enough elements
+            while len(self.column_widths[url]) <= logical_index:
+                self.column_widths[url].append(0)
 
-                # Apply the new column width
-                self.column_widths[feed['url']][logical_index] = new_size
-        self.save_feeds()  # Save to persistent storage    
+            # Apply the new column width
+            self.column_widths[url][logical_index] = new_size
+        self.feeds_save_timer.start()  # sectionResized fires for every pixel of a drag
 
     def save_geometry_and_state(self, settings):
         """Saves the window geometry and state."""
@@ -1248,15 +1554,31 @@ class RSSReader(QMainWindow):
         """Saves UI element visibility settings."""
         settings.setValue('statusbar_visible', self.statusBar().isVisible())
         settings.setValue('toolbar_visible', self.toolbar.isVisible())
-        settings.setValue('menubar_visible', self.menuBar().isVisible())
+        settings.setValue('menubar_visible', self.menu_bar.isVisible())
+
+    def write_json_file(self, path, data):
+        """Serializes data compactly and queues it for the background file writer."""
+        self.file_writer.write(path, self.file_writer.serialize(data))
+
+    def invalidate_movie_cache(self, settings):
+        """Bumps the movie cache version so cached OMDb results are no longer used."""
+        self.movie_cache_version += 1
+        settings.setValue('movie_cache_version', self.movie_cache_version)
+        # Let articles whose lookup came back empty be fetched again
+        self.movie_data_misses.clear()
+        for feed in self.feeds:
+            for entry in feed.get('entries', []):
+                if 'movie_data' in entry and not entry['movie_data']:
+                    del entry['movie_data']
+        logging.info(f"Movie cache invalidated; now at version {self.movie_cache_version}.")
 
     def save_movie_data_cache(self):
         """Saves the movie data cache."""
         try:
-            cache_path = get_user_data_path('movie_data_cache.json')
-            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            with open(cache_path, 'w') as f:
-                json.dump(self.movie_data_cache, f, indent=4)
+            cache_path = self.movie_cache_path
+            # Cached records are never modified, so a shallow copy can be serialized off the UI thread;
+            # copying the items avoids LRUCache.__getitem__ reordering the cache while it is copied
+            self.file_writer.write(cache_path, dict(self.movie_data_cache.items()))
             logging.info("Movie data cache saved successfully.")
         except Exception as e:
             logging.error(f"Failed to save movie data cache: {e}")
@@ -1264,10 +1586,8 @@ class RSSReader(QMainWindow):
     def save_group_settings(self):
         """Saves group-specific settings to group_settings.json."""
         try:
-            group_settings_path = get_user_data_path('group_settings.json')
-            os.makedirs(os.path.dirname(group_settings_path), exist_ok=True)
-            with open(group_settings_path, 'w') as f:
-                json.dump(self.group_settings, f, indent=4)
+            group_settings_path = self.group_settings_path
+            self.write_json_file(group_settings_path, self.group_settings)
             logging.info("Group settings saved successfully.")
         except Exception as e:
             logging.error(f"Failed to save group settings: {e}")
@@ -1275,10 +1595,8 @@ class RSSReader(QMainWindow):
     def save_read_articles(self):
         """Saves the set of read articles to read_articles.json."""
         try:
-            read_articles_path = get_user_data_path('read_articles.json')
-            os.makedirs(os.path.dirname(read_articles_path), exist_ok=True)
-            with open(read_articles_path, 'w') as f:
-                json.dump(list(self.read_articles), f, indent=4)
+            read_articles_path = self.read_articles_path
+            self.write_json_file(read_articles_path, list(self.read_articles))
             logging.info(f"Saved {len(self.read_articles)} read articles.")
         except Exception as e:
             logging.error(f"Failed to save read articles: {e}")
@@ -1296,17 +1614,15 @@ class RSSReader(QMainWindow):
     def toggle_menubar_visibility(self):
         """Toggles the visibility of the menu bar."""
         visible = self.toggle_menubar_action.isChecked()
-        self.menuBar().setVisible(visible)
+        self.menu_bar.setVisible(visible)
 
     def rotate_refresh_icon(self):
         """Rotates the refresh icon during feed refresh."""
         if not self.is_refreshing:
             return
         self.refresh_icon_angle = (self.refresh_icon_angle + 30) % 360
-        pixmap = self.force_refresh_icon_pixmap
-        transform = QTransform().rotate(self.refresh_icon_angle)
-        rotated_pixmap = pixmap.transformed(transform, Qt.SmoothTransformation)
-        self.force_refresh_action.setIcon(QIcon(rotated_pixmap))
+        frame = self.refresh_icon_frames[self.refresh_icon_angle // 30]
+        self.force_refresh_action.setIcon(frame)
 
     def open_settings_dialog(self):
         """Opens the settings dialog."""
@@ -1329,7 +1645,7 @@ class RSSReader(QMainWindow):
         if not feed_url.startswith(('http://', 'https://')):
             feed_url = 'http://' + feed_url
 
-        if feed_url in [feed['url'] for feed in self.feeds]:
+        if feed_url in self.feeds_by_url:
             QMessageBox.information(self, "Duplicate Feed", "This feed URL is already added.")
             return
 
@@ -1347,7 +1663,7 @@ class RSSReader(QMainWindow):
             feed_name = feed.feed.get('title', feed_url)  # Use feed URL as a fallback if title is missing
 
         # Check for duplicate feed names only if a custom name was provided
-        if feed_name in [feed['title'] for feed in self.feeds]:
+        if any(feed['title'] == feed_name for feed in self.feeds):
             QMessageBox.warning(self, "Duplicate Name", "A feed with this name already exists.")
             return
 
@@ -1367,26 +1683,33 @@ class RSSReader(QMainWindow):
             'visible_columns': [True] * 6
         }
         self.feeds.append(feed_data)
+        self.feeds_by_url[feed_url] = feed_data
         self.add_feed_to_ui(feed_data)
 
+    def get_feed_domain(self, url):
+        """Returns the domain a feed is grouped under, parsing each URL only once."""
+        domain = self.feed_domains.get(url)
+        if domain is None:
+            domain = urlparse(url).netloc or 'Unknown Domain'
+            self.feed_domains[url] = domain
+        return domain
+
     def add_feed_to_ui(self, feed_data):
         """Adds a feed to the UI under the appropriate group with a new updates icon."""
-        parsed_url = urlparse(feed_data['url'])
-        domain = parsed_url.netloc or 'Unknown Domain'
+        domain = self.get_feed_domain(feed_data['url'])
         group_name = self.group_name_mapping.get(domain, domain)
         existing_group = self.find_or_create_group(group_name, domain)
-        feed_item = QTreeWidgetItem(existing_group)
-        feed_item.setText(0, feed_data['title'])
-        feed_item.setData(0, Qt.UserRole, feed_data['url'])
-        feed_item.setFlags(feed_item.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDragEnabled)
+        # Build the item detached and attach it once, without touching the rest of the tree
+        feed_item = self.create_feed_item(feed_data)
+        existing_group.addChild(feed_item)
 
         # **Set New Updates Icon Initially if there are new articles**
         if feed_data.get('entries'):
             # Use the existing blue dot icon
-            new_icon = self.get_unread_icon()
-            feed_item.setIcon(0, new_icon)
+            self.set_feed_new_icon(feed_data['url'], True)
 
         self.feeds_list.expandItem(existing_group)
+        return feed_item
 
     def handle_group_selection(self, group_item):
         """Handles selection of a group item."""
@@ -1409,28 +1732,41 @@ class RSSReader(QMainWindow):
 
     def find_or_create_group(self, group_name, domain):
         """Finds or creates a group in the feeds list with bold font and optional movie icon."""
-        for i in range(self.feeds_list.topLevelItemCount()):
-            group = self.feeds_list.topLevelItem(i)
-            if group.text(0) == group_name:
-                return group
-        group = QTreeWidgetItem(self.feeds_list)
-        group.setText(0, group_name)
+        group = self.group_items.get(group_name)
+        if group is not None:
+            return group
+        group = self.create_group_item(group_name)
+        self.update_group_icon(group)
+        self.feeds_list.addTopLevelItem(group)
         group.setExpanded(False)
+        return group
+
+    def create_group_item(self, group_name):
+        """Creates a detached group item and registers it under its name."""
+        group = QTreeWidgetItem()
+        group.setText(0, group_name)
+        self.group_items[group_name] = group
         group.setFlags(group.flags() & ~Qt.ItemIsSelectable)
 
         # **Set Bold Font for Group Name**
         font = group.font(0)
         font.setBold(True)
         group.setFont(0, font)
+        return group
 
-        # **Set Movie Icon if OMDb is Enabled for the Group**
-        group_settings = self.group_settings.get(group_name, {'omdb_enabled': True})
+    def update_group_icon(self, group):
+        """Shows the movie icon on a group when OMDb is enabled for it."""
+        group_settings = self.group_settings.get(group.text(0), {'omdb_enabled': True})
         if group_settings.get('omdb_enabled', True):
             group.setIcon(0, self.movie_icon)  # Use the scaled movie icon
         else:
-            group.setIcon(0, QIcon())  # No icon
+            group.setIcon(0, self.empty_icon)  # No icon
 
-        return group
+    def apply_group_icons(self):
+        """Sets the icons of all groups in one pass after the feeds list is shown."""
+        self.pending_group_icons = False
+        for group in self.group_items.values():
+            self.update_group_icon(group)
 
 
     def feeds_context_menu(self, position):
@@ -1485,13 +1821,22 @@ class RSSReader(QMainWindow):
 
     def save_group_setting(self, group_name, omdb_enabled, notifications_enabled):
         """Saves the OMDb and Notification settings for a group."""
-        self.group_settings[group_name] = {
-            'omdb_enabled': omdb_enabled,
-            'notifications_enabled': notifications_enabled
-        }
-        self.save_group_settings()  # Corrected: Removed 'settings' argument
+        # Update the group's settings in place and skip the save when nothing changed
+        group_config = self.group_settings.setdefault(group_name, {})
+        if (group_config.get('omdb_enabled') == omdb_enabled
+                and group_config.get('notifications_enabled') == notifications_enabled):
+            return
+        omdb_changed = group_config.get('omdb_enabled', True) != omdb_enabled
+        group_config['omdb_enabled'] = omdb_enabled
+        group_config['notifications_enabled'] = notifications_enabled
+        self.omdb_enabled_cache.clear()
+        self.group_settings_save_timer.start()
         self.statusBar().showMessage(f"Updated settings for group: {group_name}")
         logging.info(f"Updated settings for group '{group_name}': OMDb {'enabled' if omdb_enabled else 'disabled'}, Notifications {'enabled' if notifications_enabled else 'disabled'}.")
+        if not omdb_changed:
+            return  # Notifications only affect future fetches; the articles and icon stay as they are
+
+        # Only the shown feed is rebuilt; the group's other feeds pick up the change when selected
         current_feed = self.get_current_feed()
         if current_feed:
             current_group_name = self.get_group_name_for_feed(current_feed['url'])
@@ -1499,31 +1844,35 @@ class RSSReader(QMainWindow):
                 self.populate_articles()
 
         # **Update the Group Item's Icon**
-        for i in range(self.feeds_list.topLevelItemCount()):
-            group_item = self.feeds_list.topLevelItem(i)
-            if group_item.text(0) == group_name:
-                if omdb_enabled:
-                    group_item.setIcon(0, self.movie_icon)
-                else:
-                    group_item.setIcon(0, QIcon())
-                break
+        group_item = self.group_items.get(group_name)
+        if group_item is not None:
+            self.update_group_icon(group_item)
 
     def get_group_name_for_feed(self, feed_url):
         """Returns the group name for a given feed URL."""
-        for i in range(self.feeds_list.topLevelItemCount()):
-            group_item = self.feeds_list.topLevelItem(i)
-            for j in range(group_item.childCount()):
-                feed_item = group_item.child(j)
-                if feed_item.data(0, Qt.UserRole) == feed_url:
-                    return group_item.text(0)
-        return None
+        feed_item = self.feed_items_by_url.get(feed_url)
+        if feed_item is None or feed_item.parent() is None:
+            return None
+        return feed_item.parent().text(0)
+
+    def is_omdb_enabled(self, feed_url):
+        """Returns whether OMDb lookups are enabled for the feed's group."""
+        omdb_enabled = self.omdb_enabled_cache.get(feed_url)
+        if omdb_enabled is None:
+            group_name = self.get_group_name_for_feed(feed_url)
+            omdb_enabled = self.group_settings.get(group_name, {}).get('omdb_enabled', True)
+            self.omdb_enabled_cache[feed_url] = omdb_enabled
+        return omdb_enabled
 
     def rename_group(self, group_item):
         """Renames the selected group."""
         current_group_name = group_item.text(0)
         new_group_name, ok = QInputDialog.getText(
             self, "Rename Group", "Enter new group name:", QLineEdit.Normal, current_group_name)
-        if ok and new_group_name:
+        if ok and new_group_name and new_group_name != current_group_name:
+            if new_group_name in self.group_items:
+                QMessageBox.warning(self, "Duplicate Name", "A group with this name already exists.")
+                return
             self.update_group_name(group_item, current_group_name, new_group_name)
 
     def update_group_name(self, group_item, current_group_name, new_group_name):
@@ -1532,14 +1881,21 @@ class RSSReader(QMainWindow):
         self.group_name_mapping[domain] = new_group_name
         if current_group_name in self.group_settings:
             self.group_settings[new_group_name] = self.group_settings.pop(current_group_name)
+        self.omdb_enabled_cache.clear()
         self.save_group_names()
-        self.save_group_settings(QSettings('rocker', 'SmallRSSReader'))
+        self.group_settings_save_timer.start()
         group_item.setText(0, new_group_name)
+        self.group_items.pop(current_group_name, None)
+        self.group_items[new_group_name] = group_item
         self.statusBar().showMessage(f"Renamed group to: {new_group_name}")
         logging.info(f"Renamed group '{current_group_name}' to '{new_group_name}'.")
 
     def get_domain_for_group(self, group_name):
         """Finds the domain associated with a group name."""
+        # Groups are built per domain, so the first child feed gives the domain directly
+        group_item = self.group_items.get(group_name)
+        if group_item is not None and group_item.childCount():
+            return self.get_feed_domain(group_item.child(0).data(0, Qt.UserRole))
         for domain_key, group_name_value in self.group_name_mapping.items():
             if group_name_value == group_name:
                 return domain_key
@@ -1559,11 +1915,11 @@ class RSSReader(QMainWindow):
         new_name, ok = QInputDialog.getText(
             self, "Rename Feed", "Enter new name:", QLineEdit.Normal, current_name)
         if ok and new_name:
-            if new_name in [feed['title'] for feed in self.feeds]:
+            if any(feed['title'] == new_name for feed in self.feeds):
                 QMessageBox.warning(self, "Duplicate Name", "A feed with this name already exists.")
                 return
             url = item.data(0, Qt.UserRole)
-            feed_data = next((feed for feed in self.feeds if feed['url'] == url), None)
+            feed_data = self.feeds_by_url.get(url)
             if feed_data:
                 feed_data['title'] = new_name
                 item.setText(0, new_name)
@@ -1587,20 +1943,39 @@ class RSSReader(QMainWindow):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             url = item.data(0, Qt.UserRole)
-            self.feeds = [feed for feed in self.feeds if feed['url'] != url]
+            if url == self.displayed_feed_url:
+                # Drop the shown rows now; otherwise the next feed switch would park them under the removed URL
+                self.articles_tree.setUpdatesEnabled(False)
+                self.articles_tree.blockSignals(True)
+                try:
+                    self.articles_tree.clear()
+                finally:
+                    self.articles_tree.blockSignals(False)
+                    self.articles_tree.setUpdatesEnabled(True)
+                self.article_id_to_item = {}
+                self.displayed_feed_url = None
+            feed_data = self.feeds_by_url.pop(url, None)
+            if feed_data is not None:
+                self.feeds.remove(feed_data)
+            self.feed_items_by_url.pop(url, None)
+            self.unread_counts.pop(url, None)
+            self.parked_article_items.pop(url, None)
+            self.article_ids_by_url.pop(url, None)
+            self.entry_hashes_by_url.pop(url, None)
+            self.feeds_with_new_icon.discard(url)
             parent_group = item.parent()
             parent_group.removeChild(item)
             remaining_children = parent_group.childCount()
             if remaining_children == 0:
                 self.feeds_list.takeTopLevelItem(self.feeds_list.indexOfTopLevelItem(parent_group))
+                self.group_items.pop(parent_group.text(0), None)
             self.save_feeds()
             self.statusBar().showMessage(f"Removed feed: {feed_name}")
             logging.info(f"Removed feed: {feed_name}")
 
     def load_group_names(self):
         """Loads the group name mapping from settings."""
-        settings = QSettings('rocker', 'SmallRSSReader')
-        group_mapping = settings.value('group_name_mapping', {})
+        group_mapping = self.settings.value('group_name_mapping', {})
         if isinstance(group_mapping, str):
             try:
                 self.group_name_mapping = json.loads(group_mapping)
@@ -1613,15 +1988,14 @@ class RSSReader(QMainWindow):
 
     def save_group_names(self):
         """Saves the group name mapping to settings."""
-        settings = QSettings('rocker', 'SmallRSSReader')
-        settings.setValue('group_name_mapping', json.dumps(self.group_name_mapping))
+        self.settings.setValue('group_name_mapping', json.dumps(self.group_name_mapping))
 
     def load_feeds(self):
         """Loads the feeds and column widths from feeds.json."""
-        feeds_path = get_user_data_path('feeds.json')
+        feeds_path = self.feeds_path
         if os.path.exists(feeds_path):
             try:
-                with open(feeds_path, 'r') as f:
+                with open(feeds_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     if isinstance(data, dict):
                         self.feeds = []
@@ -1633,20 +2007,37 @@ class RSSReader(QMainWindow):
                         self.feeds = data
                     else:
                         self.feeds = []
-                # Populate feeds in the UI
-                self.feeds_list.clear()
-                for feed in self.feeds:
-                    parsed_url = urlparse(feed['url'])
-                    domain = parsed_url.netloc or 'Unknown Domain'
-                    group_name = self.group_name_mapping.get(domain, domain)
-                    existing_group = self.find_or_create_group(group_name, domain)
-                    feed_item = QTreeWidgetItem(existing_group)
-                    feed_item.setText(0, feed['title'])
-                    feed_item.setData(0, Qt.UserRole, feed['url'])
-                    feed_item.setFlags(feed_item.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDragEnabled)
+                # Populate feeds in the UI with a single layout and repaint pass
+                self.feeds_list.setUpdatesEnabled(False)
+                self.feeds_list.blockSignals(True)
+                try:
+                    self.feeds_list.clear()
+                    self.feed_items_by_url = {}
+                    self.article_ids_by_url = {}
+                    self.group_items = {}
+                    self.feeds_with_new_icon = set()
+                    # Bucket the feeds by group first, then attach each group's items in one call
+                    grouped_feeds = {}
+                    for feed in self.feeds:
+                        domain = self.get_feed_domain(feed['url'])
+                        group_name = self.group_name_mapping.get(domain, domain)
+                        grouped_feeds.setdefault(group_name, []).append(feed)
+                    group_items = []
+                    for group_name, group_feeds in grouped_feeds.items():
+                        group_item = self.create_group_item(group_name)
+                        group_item.addChildren([self.create_feed_item(feed) for feed in group_feeds])
+                        group_items.append(group_item)
+                    self.feeds_list.addTopLevelItems(group_items)
+                    # **Expand All Feed Groups**
+                    self.feeds_list.expandAll()
+                finally:
+                    self.feeds_list.blockSignals(False)
+                    self.feeds_list.setUpdatesEnabled(True)
+                # Let the list paint its names first; the group icons follow in a single pass
+                if not self.pending_group_icons:
+                    self.pending_group_icons = True
+                    QTimer.singleShot(0, self.apply_group_icons)
                 logging.info(f"Loaded {len(self.feeds)} feeds.")
-                # **Expand All Feed Groups**
-                self.feeds_list.expandAll()
             except json.JSONDecodeError:
                 QMessageBox.critical(self, "Load Error", "Failed to parse feeds.json. The file may be corrupted.")
                 logging.error("Failed to parse feeds.json.")
@@ -1679,6 +2070,12 @@ class RSSReader(QMainWindow):
             ]
             self.save_feeds()
             logging.info("Created default feeds.json with initial feeds.")
+        self.rebuild_feeds_index()
+        self.recount_unread()
+
+    def rebuild_feeds_index(self):
+        """Rebuilds the mapping from feed URL to feed data."""
+        self.feeds_by_url = {feed['url']: feed for feed in self.feeds}
 
     def save_feeds(self):
         """Saves the feeds and column widths to feeds.json."""
@@ -1687,10 +2084,8 @@ class RSSReader(QMainWindow):
                 'feeds': self.feeds,
                 'column_widths': self.column_widths,
             }
-            feeds_path = get_user_data_path('feeds.json')
-            os.makedirs(os.path.dirname(feeds_path), exist_ok=True)
-            with open(feeds_path, 'w') as f:
-                json.dump(feeds_data, f, indent=4)
+            feeds_path = self.feeds_path
+            self.write_json_file(feeds_path, feeds_data)
             logging.info("Feeds and column widths saved successfully.")
         except Exception as e:
             logging.error(f"Failed to save feeds: {e}")
@@ -1705,15 +2100,9 @@ class RSSReader(QMainWindow):
                         raise parsed_feed.bozo_exception
                     feed_title = parsed_feed.feed.get('title', feed['url'])
                     feed['title'] = feed_title
-                    parsed_url = urlparse(feed['url'])
-                    domain = parsed_url.netloc or 'Unknown Domain'
-                    group_name = self.group_name_mapping.get(domain, domain)
-                    group = self.find_or_create_group(group_name, domain)
-                    for j in range(group.childCount()):
-                        child = group.child(j)
-                        if child.data(0, Qt.UserRole) == feed['url']:
-                            child.setText(0, feed_title)
-                            break
+                    feed_item = self.feed_items_by_url.get(feed['url'])
+                    if feed_item is not None:
+                        feed_item.setText(0, feed_title)
                 except Exception as e:
                     logging.error(f"Error updating feed title for {feed['url']}: {e}")
         self.save_feeds()
@@ -1729,17 +2118,22 @@ class RSSReader(QMainWindow):
             self.handle_group_selection(item)
             return
         url = item.data(0, Qt.UserRole)
-        feed_data = next((feed for feed in self.feeds if feed['url'] == url), None)
+        feed_data = self.feeds_by_url.get(url)
         if feed_data and 'entries' in feed_data and feed_data['entries']:
             self.current_entries = feed_data['entries']
             self.populate_articles()
         else:
             self.statusBar().showMessage(f"Loading articles from {item.text(0)}")
-            thread = FetchFeedThread(url)
-            thread.feed_fetched.connect(self.on_feed_fetched)
-            self.threads.append(thread)
-            thread.finished.connect(lambda t=thread: self.remove_thread(t))
-            thread.start()
+            self.start_feed_fetch(url, self.feed_worker)
+
+    def start_feed_fetch(self, url, worker):
+        """Queues a feed fetch on the thread pool unless one is already in flight; returns whether it was queued."""
+        if url in self.fetching_urls:
+            logging.debug(f"Fetch already in progress for feed: {url}")
+            return False
+        self.fetching_urls.add(url)
+        self.thread_pool.start(FetchFeedRunnable(url, worker))
+        return True
 
     def display_content(self):
         """Displays the content of the selected article and removes new icon if necessary."""
@@ -1748,12 +2142,74 @@ class RSSReader(QMainWindow):
             return
         item = selected_items[0]
 
-        # Retrieve the entry directly from the item's data
-        entry = item.data(0, Qt.UserRole)
+        # Retrieve the entry directly from the item
+        entry = item.entry
         if not entry:
             return
         title = entry.get('title', 'No Title')
-        date_formatted = item.text(1)
+        html_content = self.get_article_html(item)
+
+        # Use the article's own feed; the selected feed may still be loading while these rows are shown
+        feed_url = item.feed_url
+        # **Remove New Articles Icon as an article is being opened**
+        self.set_feed_new_icon(feed_url, False)
+        # A click also fires itemSelectionChanged; reload the page only when its HTML changed
+        if html_content is not self.shown_article_html:
+            self.ensure_content_view().setHtml(html_content, baseUrl=QUrl(feed_url))
+            self.shown_article_html = html_content
+        self.statusBar().showMessage(f"Displaying article: {title}")
+
+        # Mark as read instantly
+        article_id = item.article_id
+        if article_id not in self.read_articles:
+            self.read_articles.add(article_id)
+            self.set_article_unread(item, False)  # Remove the unread icon
+            if self.unread_counts.get(feed_url):
+                self.unread_counts[feed_url] -= 1
+                self.schedule_tray_tooltip_update()
+            self.read_articles_save_timer.start()
+            logging.debug(f"Marked article as read: {title}")
+
+    def get_article_html(self, item):
+        """Returns the rendered HTML for an article item, rendering it on a cache miss."""
+        article_id = item.article_id
+        if article_id in self.article_html_cache:
+            return self.article_html_cache[article_id]
+        html_content = self.build_article_html(item.entry)
+        self.article_html_cache[article_id] = html_content
+        return html_content
+
+    def schedule_prefetch(self):
+        """Restarts the prefetch delay after a selection change or scroll."""
+        self.prefetch_timer.start()
+
+    def prefetch_visible_articles(self):
+        """Pre-renders the visible articles and the current one's neighbours while the user is reading."""
+        bottom = self.articles_tree.viewport().height()
+        item = self.articles_tree.itemAt(0, 0)
+        rendered = 0
+        while item is not None and rendered < self.PREFETCH_LIMIT:
+            if self.articles_tree.visualItemRect(item).top() > bottom:
+                break
+            if item.entry and item.article_id not in self.article_html_cache:
+                self.get_article_html(item)
+                rendered += 1
+            item = self.articles_tree.itemBelow(item)
+
+        # Arrow-key reading lands next on a neighbour of the current row, which may be off screen
+        current = self.articles_tree.currentItem()
+        if current is not None:
+            for neighbour in (self.articles_tree.itemBelow(current), self.articles_tree.itemAbove(current)):
+                if neighbour is not None and neighbour.entry and neighbour.article_id not in self.article_html_cache:
+                    self.get_article_html(neighbour)
+                    rendered += 1
+        if rendered:
+            logging.debug(f"Pre-rendered {rendered} articles.")
+
+    def build_article_html(self, entry):
+        """Renders an article and its movie details into the content view HTML."""
+        escape = html.escape
+        title = entry.get('title', 'No Title')
 
         if 'content' in entry and entry['content']:
             content = entry['content'][0].get('value', '')
@@ -1762,137 +2218,49 @@ class RSSReader(QMainWindow):
         else:
             content = ''
 
-        images_html = ''
         if 'media_content' in entry:
-            for media in entry.get('media_content', []):
-                img_url = media.get('url')
-                if img_url:
-                    images_html += f'<img src="{img_url}" alt="" /><br/>'
+            img_urls = [media.get('url') for media in entry.get('media_content', [])]
         elif 'media_thumbnail' in entry:
-            for media in entry.get('media_thumbnail', []):
-                img_url = media.get('url')
-                if img_url:
-                    images_html += f'<img src="{img_url}" alt="" /><br/>'
+            img_urls = [media.get('url') for media in entry.get('media_thumbnail', [])]
         elif 'links' in entry:
-            for link in entry.get('links', []):
-                if link.get('rel') == 'enclosure' and 'image' in link.get('type', ''):
-                    img_url = link.get('href')
-                    if img_url:
-                        images_html += f'<img src="{img_url}" alt="" /><br/>'
-
-        link = entry.get('link', '')
+            img_urls = [
+                link.get('href') for link in entry.get('links', [])
+                if link.get('rel') == 'enclosure' and 'image' in link.get('type', '')
+            ]
+        else:
+            img_urls = []
+        images_html = ''.join(f'<img src="{escape(img_url)}" alt="" /><br/>' for img_url in img_urls if img_url)
 
+        movie_parts = []
         movie_data = entry.get('movie_data', {})
-        movie_info_html = ''
         if movie_data:
             poster_url = movie_data.get('poster', '')
             if poster_url and poster_url != 'N/A':
-                movie_info_html += f'<img src="{poster_url}" alt="Poster" style="max-width:200px;" /><br/>'
-            details = [
-                ('Released', movie_data.get('released', '')),
-                ('Plot', movie_data.get('plot', '')),
-                ('Writer', movie_data.get('writer', '')),
-                ('Actors', movie_data.get('actors', '')),
-                ('Language', movie_data.get('language', '')),
-                ('Country', movie_data.get('country', '')),
-                ('Awards', movie_data.get('awards', '')),
-                ('DVD Release', movie_data.get('dvd', '')),
-                ('Box Office', movie_data.get('boxoffice', '')),
-            ]
-            for label, value in details:
+                movie_parts.append(f'<img src="{escape(poster_url)}" alt="Poster" style="max-width:200px;" /><br/>')
+            for label, key in MOVIE_DETAIL_FIELDS:
+                value = movie_data.get(key)
                 if value and value != 'N/A':
-                    movie_info_html += f'<p><strong>{label}:</strong> {value}</p>'
+                    movie_parts.append(f'<p><strong>{label}:</strong> {escape(str(value))}</p>')
             ratings = movie_data.get('ratings', [])
             if ratings:
-                ratings_html = '<ul>'
-                for rating in ratings:
-                    ratings_html += f"<li>{rating.get('Source')}: {rating.get('Value')}</li>"
-                ratings_html += '</ul>'
-                movie_info_html += f'<p><strong>Ratings:</strong>{ratings_html}</p>'
-
-        styles = """
-        <style>
-        body {
-            max-width: 800px;
-            margin: auto;
-            padding: 5px;
-            font-family: 'Helvetica Neue', Helvetica, Arial, sans-serif;
-            font-size: 16px;
-            line-height: 1.6;
-            color: #333;
-            background-color: #f9f9f9;
-        }
-        h3 {
-            font-size: 18px;
-        }
-        p {
-            margin: 0 0 5px;
-        }
-        img {
-            max-width: 100%;
-            height: auto;
-            display: block;
-            margin: 5px 0;
-        }
-        a {
-            color: #1e90ff;
-            text-decoration: none;
-        }
-        a:hover {
-            text-decoration: underline;
-        }
-        blockquote {
-            margin: 5px 0;
-            padding: 5px 20px;
-            background-color: #f0f0f0;
-            border-left: 5px solid #ccc;
-        }
-        code {
-            font-family: monospace;
-            background-color: #f0f0f0;
-            padding: 2px 4px;
-            border-radius: 4px;
-        }
-        pre {
-            background-color: #f0f0f0;
-            padding: 10px;
-            overflow: auto;
-            border-radius: 4px;
-        }
-        </style>
-        """
+                movie_parts.append('<p><strong>Ratings:</strong><ul>')
+                movie_parts.extend(
+                    f"<li>{escape(str(rating.get('Source')))}: {escape(str(rating.get('Value')))}</li>"
+                    for rating in ratings
+                )
+                movie_parts.append('</ul></p>')
 
-        if link:
-            read_more = f'<p><a href="{link}">Read more</a></p>'
-        else:
-            read_more = ''
-
-        html_content = f"""
-        {styles}
-        <h3>{title}</h3>
-        {images_html}
-        {content}
-        {movie_info_html}
-        {read_more}
-        """
+        link = entry.get('link', '')
+        read_more = f'<p><a href="{escape(link)}">Read more</a></p>' if link else ''
 
-        current_feed_item = self.feeds_list.currentItem()
-        if current_feed_item:
-            feed_url = current_feed_item.data(0, Qt.UserRole)
-            # **Remove New Articles Icon as an article is being opened**
-            self.set_feed_new_icon(feed_url, False)
-        else:
-            feed_url = QUrl()
-        self.content_view.setHtml(html_content, baseUrl=QUrl(feed_url))
-        self.statusBar().showMessage(f"Displaying article: {title}")
-
-        # Mark as read instantly
-        article_id = item.data(0, Qt.UserRole + 1)
-        if article_id not in self.read_articles:
-            self.read_articles.add(article_id)
-            item.setIcon(0, QIcon())  # Remove the unread icon
-            self.save_read_articles()
-            logging.debug(f"Marked article as read: {title}")
+        return ARTICLE_TEMPLATE.format_map({
+            'styles': ARTICLE_STYLES,
+            'title': escape(title),
+            'images': images_html,
+            'content': content,
+            'movie_info': ''.join(movie_parts),
+            'read_more': read_more,
+        })
 
     def populate_articles(self):
         """Populates the articles tree with the current entries using delta updates."""
@@ -1902,34 +2270,46 @@ class RSSReader(QMainWindow):
         if not current_feed:
             self.articles_tree.clear()
             self.article_id_to_item = {}
+            self.displayed_feed_url = None
             self.statusBar().showMessage("No feed selected")
             return
 
-        # Restore column widths for the current feed
+        # Restore column widths for the current feed; restoring must not echo back into save_column_widths
         feed_url = current_feed['url']
+        header = self.articles_tree.header()
         if feed_url not in self.column_widths:
-            self.column_widths[feed_url] = [100] * self.articles_tree.header().count()  # Default widths
-        for index, width in enumerate(self.column_widths[feed_url]):
-            self.articles_tree.header().resizeSection(index, width)
+            self.column_widths[feed_url] = [100] * header.count()  # Default widths
+        self.restoring_columns = True
+        try:
+            for index, width in enumerate(self.column_widths[feed_url]):
+                header.resizeSection(index, width)
+        finally:
+            self.restoring_columns = False
 
         # Retrieve settings for the feed group
-        group_name = self.get_group_name_for_feed(feed_url)
-        group_settings = self.group_settings.get(group_name, {'omdb_enabled': True})
-        omdb_enabled = group_settings.get('omdb_enabled', True)
+        omdb_enabled = self.is_omdb_enabled(feed_url)
 
-        # Update column visibility based on OMDb settings
+        # Update column visibility based on OMDb settings; only save when it actually changed
         if not omdb_enabled:
-            current_feed['visible_columns'] = [True, True, False, False, False, False]
-            self.save_feeds()
+            plain_columns = [True, True, False, False, False, False]
+            if current_feed.get('visible_columns') != plain_columns:
+                current_feed['visible_columns'] = plain_columns
+                self.feeds_save_timer.start()
         elif 'visible_columns' not in current_feed:
             current_feed['visible_columns'] = [True] * 6
-            self.save_feeds()
-
-        # Prepare for delta updates
-        current_items = {
-            item.data(0, Qt.UserRole + 1): item  # Map by article ID
-            for item in self.get_all_tree_items(self.articles_tree)
-        }
+            self.feeds_save_timer.start()
+
+        # Prepare for delta updates; when switching feeds, park the shown rows and reuse the new feed's
+        switched_feed = feed_url != self.displayed_feed_url
+        if switched_feed:
+            self.park_article_items()
+            current_items = self.parked_article_items.pop(feed_url, {})
+            self.displayed_feed_url = feed_url
+        else:
+            current_items = {
+                item.article_id: item  # Map by article ID
+                for item in self.get_all_tree_items(self.articles_tree)
+            }
         self.article_id_to_item = current_items
         new_entries = {self.get_article_id(entry): entry for entry in self.current_entries}
 
@@ -1938,110 +2318,186 @@ class RSSReader(QMainWindow):
         updated_ids = new_entries.keys() & current_items.keys()
         removed_ids = current_items.keys() - new_entries.keys()
 
-        # Add new articles
-        for article_id in added_ids:
-            entry = new_entries[article_id]
-            self.add_article_to_tree(entry)
-
-        # Update existing articles
-        for article_id in updated_ids:
-            entry = new_entries[article_id]
-            item = current_items[article_id]
-            self.update_article_in_tree(item, entry)
-
-        # Remove obsolete articles
-        for article_id in removed_ids:
-            item = current_items[article_id]
-            index = self.articles_tree.indexOfTopLevelItem(item)
-            self.articles_tree.takeTopLevelItem(index)
-
-        # Reapply sorting
-        sort_column = current_feed.get('sort_column', 1)
-        sort_order = current_feed.get('sort_order', Qt.AscendingOrder)
-        self.articles_tree.sortItems(sort_column, sort_order)
-
-        # Apply column visibility
-        for i, visible in enumerate(current_feed['visible_columns']):
-            self.articles_tree.setColumnHidden(i, not visible)
+        self.articles_tree.setUpdatesEnabled(False)
+        self.articles_tree.blockSignals(True)
+        try:
+            if switched_feed and current_items:
+                self.articles_tree.addTopLevelItems(list(current_items.values()))
+
+            # Remove obsolete articles
+            if not updated_ids:
+                # Nothing is kept (e.g. switching feeds), so drop everything at once
+                self.articles_tree.clear()
+                self.article_id_to_item = {}
+            else:
+                for article_id in removed_ids:
+                    item = self.article_id_to_item.pop(article_id)
+                    index = self.articles_tree.indexOfTopLevelItem(item)
+                    self.articles_tree.takeTopLevelItem(index)
+
+            # Update existing articles
+            for article_id in updated_ids:
+                entry = new_entries[article_id]
+                item = current_items[article_id]
+                self.update_article_in_tree(item, entry)
+
+            # Add new articles in a single batch, presorted in Python when sorting by date
+            sort_column = current_feed.get('sort_column', 1)
+            sort_order = current_feed.get('sort_order', Qt.AscendingOrder)
+            new_items = [self.create_article_item(new_entries[article_id], feed_url) for article_id in added_ids]
+            if sort_column == DATE_COLUMN:
+                new_items.sort(key=lambda item: item.date_value, reverse=sort_order == Qt.DescendingOrder)
+            self.articles_tree.addTopLevelItems(new_items)
+
+            # Enabling sorting sorts once by the indicator, so no separate sortItems pass is needed
+            self.articles_tree.header().setSortIndicator(sort_column, sort_order)
+            self.articles_tree.setSortingEnabled(True)
+        finally:
+            self.articles_tree.blockSignals(False)
+            self.articles_tree.setUpdatesEnabled(True)
+
+        # Apply column visibility; hiding a section reports it as resized to zero
+        self.restoring_columns = True
+        try:
+            for i, visible in enumerate(current_feed['visible_columns']):
+                # Feeds of the same kind share the layout, so most switches change nothing here
+                if self.articles_tree.isColumnHidden(i) == visible:
+                    self.articles_tree.setColumnHidden(i, not visible)
+        finally:
+            self.restoring_columns = False
 
         # Automatically select the first article if available
         if self.articles_tree.topLevelItemCount() > 0:
             first_item = self.articles_tree.topLevelItem(0)
             self.articles_tree.setCurrentItem(first_item)
 
-        self.articles_tree.setSortingEnabled(True)
         self.statusBar().showMessage(f"Loaded {len(self.current_entries)} articles")
 
-        # Fetch movie data if applicable
+        # Keep the active search applied to rows added by this update; parked rows may hold an old one
+        if self.search_input.text() or switched_feed:
+            self.filter_articles(self.search_input.text())
+
+        # Fetch movie data if applicable, once per feed and only while something is missing
         if omdb_enabled and self.api_key:
-            movie_thread = FetchMovieDataThread(self.current_entries, self.api_key, self.movie_data_cache)
-            movie_thread.movie_data_fetched.connect(self.update_movie_info)
-            self.threads.append(movie_thread)
-            movie_thread.finished.connect(lambda t=movie_thread: self.remove_thread(t))
-            movie_thread.start()
+            if feed_url in self.movie_fetch_urls:
+                logging.debug(f"Movie data for feed '{feed_url}' is already being fetched.")
+            elif not any(map(self.needs_movie_data, self.current_entries)):
+                logging.debug(f"All articles in feed '{feed_url}' already have movie data.")
+            else:
+                self.start_movie_data_fetch(feed_url)
         else:
-            logging.info(f"OMDb feature disabled for group '{group_name}' or API key not provided; skipping movie data fetching.")
+            logging.info(f"OMDb feature disabled for feed '{feed_url}' or API key not provided; skipping movie data fetching.")
 
         self.apply_font_size()
-        
-    def add_article_to_tree(self, entry):
-        """Adds a new article to the tree."""
+        self.prefetch_timer.start()
+
+    def park_article_items(self):
+        """Detaches the shown article rows and keeps them for when their feed is selected again."""
+        if self.displayed_feed_url is None:
+            return
+        self.articles_tree.setUpdatesEnabled(False)
+        self.articles_tree.blockSignals(True)
+        try:
+            self.articles_tree.clearSelection()
+            self.articles_tree.invisibleRootItem().takeChildren()
+        finally:
+            self.articles_tree.blockSignals(False)
+            self.articles_tree.setUpdatesEnabled(True)
+        if self.article_id_to_item:
+            self.parked_article_items[self.displayed_feed_url] = self.article_id_to_item
+        self.article_id_to_item = {}
+        self.displayed_feed_url = None
+
+    def needs_movie_data(self, entry):
+        """Returns whether an entry still lacks movie data and has not come back empty this session."""
+        return not entry.get('movie_data') and self.get_article_id(entry) not in self.movie_data_misses
+
+    def start_movie_data_fetch(self, feed_url):
+        """Starts fetching movie data for the current entries of a feed."""
+        self.movie_fetch_urls.add(feed_url)
+        pending_entries = [entry for entry in self.current_entries if self.needs_movie_data(entry)]
+        movie_thread = FetchMovieDataThread(pending_entries, self.api_key, self.movie_data_cache, self.movie_cache_version)
+        movie_thread.movie_data_fetched.connect(self.update_movie_info)
+        self.threads.append(movie_thread)
+        movie_thread.finished.connect(lambda t=movie_thread: self.remove_thread(t))
+        movie_thread.finished.connect(lambda u=feed_url: self.movie_fetch_urls.discard(u))
+        movie_thread.start()
+
+    def create_article_item(self, entry, feed_url):
+        """Creates a tree item for a new article; the caller adds it to the tree."""
         title = entry.get('title', 'No Title')
-        item = ArticleTreeWidgetItem([title, '', '', '', '', ''])
+        date_key = self.get_entry_date_key(entry)
+        date_value, date_formatted = self.format_article_date(date_key)
 
-        # Set Date
-        date_struct = entry.get('published_parsed', entry.get('updated_parsed', None))
-        if date_struct:
-            date_obj = datetime.datetime(*date_struct[:6])
-            date_formatted = date_obj.strftime('%d-%m-%Y')
+        # Build the whole row in one go, including the OMDb columns when the movie data is known
+        movie_data = entry.get('movie_data')
+        if movie_data:
+            movie_texts, rating_value, release_value = self.get_movie_columns(movie_data)
         else:
-            date_obj = datetime.datetime.min
-            date_formatted = 'No Date'
-        item.setText(1, date_formatted)
-        item.setData(1, Qt.UserRole, date_obj)
-
-        # Set default values for other columns
-        item.setText(2, 'N/A')
-        item.setText(3, '')
-        item.setText(4, '')
-        item.setText(5, '')
+            movie_texts = ('N/A', '', '', '')
+        item = ArticleTreeWidgetItem([title, date_formatted, *movie_texts])
+        item.search_text = title.lower()  # Precomputed haystack for the search filter
+        item.date_value = date_value  # Python-side sort key for the date column
+        item.date_key = date_key
+        if movie_data:
+            item.rating_value = rating_value
+            item.release_value = release_value
 
         # Store article data
         article_id = self.get_article_id(entry)
-        item.setData(0, Qt.UserRole + 1, article_id)
-        item.setData(0, Qt.UserRole, entry)
+        item.article_id = article_id
+        item.feed_url = feed_url
+        item.entry = entry
 
-        # Set unread icon if applicable
+        # Set unread icon if applicable; new items start without an icon
         if article_id not in self.read_articles:
-            item.setIcon(0, self.get_unread_icon())
-        else:
-            item.setIcon(0, QIcon())
+            self.set_article_unread(item, True)
 
-        self.articles_tree.addTopLevelItem(item)
         self.article_id_to_item[article_id] = item
-        
+        return item
+
     def update_article_in_tree(self, item, entry):
         """Updates an existing article in the tree."""
         title = entry.get('title', 'No Title')
-        item.setText(0, title)
-
-        # Update Date
+        # Refresh the title and its search haystack only when the title changed
+        if title != item.text(0):
+            item.setText(0, title)
+            item.search_text = title.lower()
+        if item.entry is not entry:
+            self.article_html_cache.pop(item.article_id, None)
+        item.entry = entry
+
+        # Update Date only when it changed; formatting it is the costly part
+        date_key = self.get_entry_date_key(entry)
+        if date_key != item.date_key:
+            self.set_article_date(item, date_key)
+
+    def get_entry_date_key(self, entry):
+        """Returns the entry's date as a (year, month, day, hour, minute, second) tuple, or None."""
         date_struct = entry.get('published_parsed', entry.get('updated_parsed', None))
         if date_struct:
-            date_obj = datetime.datetime(*date_struct[:6])
-            date_formatted = date_obj.strftime('%d-%m-%Y')
-        else:
-            date_obj = datetime.datetime.min
-            date_formatted = 'No Date'
-        item.setText(1, date_formatted)
-        item.setData(1, Qt.UserRole, date_obj)
-        
+            return tuple(date_struct[:6])
+        return None
+
+    def format_article_date(self, date_key):
+        """Returns the sort key and display string for an entry date key."""
+        # The key tuple already sorts chronologically, so no datetime is built per article
+        if date_key:
+            year, month, day = date_key[:3]
+            return date_key, f'{day:02d}-{month:02d}-{year:04d}'
+        return (), 'No Date'
+
+    def set_article_date(self, item, date_key):
+        """Sets the date column of an article item."""
+        date_value, date_formatted = self.format_article_date(date_key)
+        item.setText(DATE_COLUMN, date_formatted)
+        item.date_value = date_value  # Python-side sort key for the date column
+        item.date_key = date_key
+
     def get_all_tree_items(self, tree_widget):
         """Returns all items in the QTreeWidget as a list."""
-        items = []
-        for index in range(tree_widget.topLevelItemCount()):
-            items.append(tree_widget.topLevelItem(index))
-        return items
+        top_level_item = tree_widget.topLevelItem
+        return [top_level_item(index) for index in range(tree_widget.topLevelItemCount())]
         
     def get_current_feed(self):
         """Returns the currently selected feed data."""
@@ -2052,7 +2508,7 @@ class RSSReader(QMainWindow):
         if item.parent() is None:
             return None  # A group is selected, not a feed
         url = item.data(0, Qt.UserRole)
-        feed_data = next((feed for feed in self.feeds if feed['url'] == url), None)
+        feed_data = self.feeds_by_url.get(url)
         return feed_data
 
     def remove_thread(self, thread):
@@ -2064,68 +2520,134 @@ class RSSReader(QMainWindow):
             else:
                 logging.debug("Removed a thread without a URL attribute.")
 
-    def update_movie_info(self, index, movie_data):
+    def update_movie_info(self, entry, movie_data):
         """Updates the article item with movie data."""
-        if index < 0 or index >= len(self.current_entries):
-            logging.error(f"update_movie_info called with out-of-range index: {index}. Current entries count: {len(self.current_entries)}.")
-            return  # Safely exit the function to prevent the crash
-        entry = self.current_entries[index]
         article_id = self.get_article_id(entry)
-        # Skip update if article is no longer present
-        if article_id not in self.article_id_to_item:
-            logging.warning(f"Skipped update: Article ID {article_id} not found in tree.")
+        if not movie_data:
+            # Not found or a failed request; remember it for this session only so a later refresh retries
+            self.movie_data_misses.add(article_id)
+            entry.pop('movie_data', None)
             return
+        # Update the entry with the fetched movie data, even if its feed is no longer shown
+        entry['movie_data'] = movie_data
+        self.movie_cache_save_timer.start()
+        self.article_html_cache.pop(article_id, None)  # The rendered page now lacks the movie details
         item = self.article_id_to_item.get(article_id)
-        if item:
-            imdb_rating = movie_data.get('imdbrating', 'N/A')  # Corrected key
-            rating_value = self.parse_rating(imdb_rating)
-            item.setData(2, Qt.UserRole, rating_value)
-            item.setText(2, imdb_rating)
-
-            released = movie_data.get('released', '')
-            release_date = self.parse_release_date(released)
-            item.setData(3, Qt.UserRole, release_date)
-            item.setText(3, release_date.strftime('%d %b %Y') if release_date != datetime.datetime.min else '')
-
-            genre = movie_data.get('genre', '')
-            director = movie_data.get('director', '')
-            item.setText(4, genre)
-            item.setText(5, director)
-
-            # Update the entry with the fetched movie data
-            entry['movie_data'] = movie_data
-        else:
-            logging.warning(f"No QTreeWidgetItem found for article ID: {article_id}")
+        if item is None:
+            # The row may be parked with another feed's articles
+            item = next((items[article_id] for items in self.parked_article_items.values() if article_id in items), None)
+        if item is None:
+            logging.debug(f"Article ID {article_id} is not in the tree; stored movie data on the entry only.")
+            return
+        self.apply_movie_data(item, movie_data)
+
+    def apply_movie_data(self, item, movie_data):
+        """Fills the OMDb columns of an article item."""
+        # Set the sort keys first; setText re-sorts the tree when it sorts by an OMDb column
+        movie_texts, item.rating_value, item.release_value = self.get_movie_columns(movie_data)
+        for column, text in zip(OMDB_COLUMN_ORDER, movie_texts):
+            item.setText(column, text)
+
+    def get_movie_columns(self, movie_data):
+        """Returns the OMDb column texts and the rating and release sort keys for movie data."""
+        imdb_rating = movie_data.get('imdbrating', 'N/A')  # Corrected key
+        release_date, released_text = self.parse_release_date(movie_data.get('released', ''))
+        movie_texts = (imdb_rating, released_text, movie_data.get('genre', ''), movie_data.get('director', ''))
+        return movie_texts, (0, self.parse_rating(imdb_rating)), (1, release_date)
 
     def parse_rating(self, rating_str):
         """Parses the IMDb rating string to a float value."""
+        if not rating_str or rating_str == 'N/A':
+            return 0.0  # Common for non-movies; skip the exception path
         try:
             return float(rating_str.split('/')[0])
         except (ValueError, IndexError):
             return 0.0
 
-    def parse_release_date(self, released_str):
-        """Parses the release date string to a datetime object."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_release_date(released_str):
+        """Parses the release date string to a datetime object and its display text."""
+        if not released_str or released_str == 'N/A':
+            return datetime.datetime.min, ''
         try:
-            return datetime.datetime.strptime(released_str, '%d %b %Y')
+            release_date = datetime.datetime.strptime(released_str, '%d %b %Y')
         except (ValueError, TypeError):
-            return datetime.datetime.min
+            return datetime.datetime.min, ''
+        return release_date, release_date.strftime('%d %b %Y')
 
     def get_unread_icon(self):
         """Returns the icon used for unread articles."""
-        pixmap = QPixmap(10, 10)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        painter.setBrush(QBrush(QColor(0, 122, 204)))
-        painter.setPen(Qt.NoPen)
-        painter.drawEllipse(0, 0, 10, 10)
-        painter.end()
-        return QIcon(pixmap)
+        if self.unread_icon is None:
+            pixmap = QPixmap(10, 10)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setBrush(QBrush(QColor(0, 122, 204)))
+            painter.setPen(Qt.NoPen)
+            painter.drawEllipse(0, 0, 10, 10)
+            painter.end()
+            self.unread_icon = QIcon(pixmap)
+        return self.unread_icon
+
+    def recount_unread(self):
+        """Recounts the unread articles of every feed."""
+        read_articles = self.read_articles
+        get_feed_article_ids = self.get_feed_article_ids
+        # Set difference counts in C instead of testing each entry in Python
+        self.unread_counts = {feed['url']: len(get_feed_article_ids(feed) - read_articles) for feed in self.feeds}
+        self.update_tray_tooltip()
+
+    def get_feed_article_ids(self, feed):
+        """Returns the set of stored article IDs of a feed, building it on first use."""
+        article_ids = self.article_ids_by_url.get(feed['url'])
+        if article_ids is None:
+            article_ids = set(map(self.get_article_id, feed.get('entries', [])))
+            self.article_ids_by_url[feed['url']] = article_ids
+        return article_ids
+
+    def schedule_tray_tooltip_update(self):
+        """Updates the tray tooltip once for a burst of unread count changes."""
+        if not self.tray_tooltip_update_scheduled:
+            self.tray_tooltip_update_scheduled = True
+            QTimer.singleShot(150, self.update_tray_tooltip)
+
+    def update_tray_tooltip(self):
+        """Shows the total number of unread articles in the tray tooltip."""
+        self.tray_tooltip_update_scheduled = False
+        if self.tray_icon is None:
+            return
+        total_unread = sum(self.unread_counts.values())
+        if total_unread:
+            self.tray_icon.setToolTip(f"Small RSS Reader - {total_unread} unread")
+        else:
+            self.tray_icon.setToolTip("Small RSS Reader")
+
+    def refresh_article_icons(self):
+        """Updates the unread icons of the articles in the tree to match the read state."""
+        read_articles = self.read_articles
+        set_article_unread = self.set_article_unread
+        self.articles_tree.setUpdatesEnabled(False)
+        try:
+            for article_id, item in self.article_id_to_item.items():
+                set_article_unread(item, article_id not in read_articles)
+        finally:
+            self.articles_tree.setUpdatesEnabled(True)
+
+    def set_article_unread(self, item, unread):
+        """Shows or clears an article's unread icon, skipping items already in that state."""
+        if item.is_unread == unread:
+            return
+        item.is_unread = unread
+        item.setIcon(0, self.get_unread_icon() if unread else self.empty_icon)
 
     def get_article_id(self, entry):
         """Generates a unique ID for an article."""
-        unique_string = entry.get('id') or entry.get('guid') or entry.get('link') or (entry.get('title', '') + entry.get('published', ''))
-        return hashlib.md5(unique_string.encode('utf-8')).hexdigest()
+        article_id = entry.get('_aid')
+        if article_id is None:
+            unique_string = entry.get('id') or entry.get('guid') or entry.get('link') or (entry.get('title', '') + entry.get('published', ''))
+            article_id = hashlib.md5(unique_string.encode('utf-8')).hexdigest()
+            entry['_aid'] = article_id  # Memoize on the entry; it is persisted with the feed
+        return article_id
 
     def mark_feed_unread(self):
         """Marks all articles in the selected feed as unread."""
@@ -2138,7 +2660,7 @@ class RSSReader(QMainWindow):
             QMessageBox.information(self, "Invalid Selection", "Please select a feed, not a group.")
             return
         url = item.data(0, Qt.UserRole)
-        feed_data = next((feed for feed in self.feeds if feed['url'] == url), None)
+        feed_data = self.feeds_by_url.get(url)
         if not feed_data or 'entries' not in feed_data:
             QMessageBox.warning(self, "No Entries", "No articles found for the selected feed.")
             return
@@ -2146,22 +2668,40 @@ class RSSReader(QMainWindow):
                                      'Are you sure you want to mark all articles in this feed as unread?',
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            for entry in feed_data['entries']:
-                article_id = self.get_article_id(entry)
-                if article_id in self.read_articles:
-                    self.read_articles.remove(article_id)
-            self.save_read_articles()
-            self.load_articles()
+            article_ids = self.get_feed_article_ids(feed_data)
+            self.read_articles -= article_ids
+            self.unread_counts[url] = len(article_ids)
+            self.update_tray_tooltip()
+            self.read_articles_save_timer.start()
+            self.refresh_article_icons()
             logging.info(f"Marked all articles in feed '{feed_data['title']}' as unread.")
 
+    def schedule_search_filter(self, text):
+        """Applies the search once typing pauses; clearing the search applies immediately."""
+        if text:
+            self.search_timer.start()
+        else:
+            self.search_timer.stop()
+            self.filter_articles(text)
+
+    def apply_search_filter(self):
+        """Filters the articles with the current search text."""
+        self.filter_articles(self.search_input.text())
+
     def filter_articles(self, text):
         """Filters the articles based on the search input."""
-        for i in range(self.articles_tree.topLevelItemCount()):
-            item = self.articles_tree.topLevelItem(i)
-            if text.lower() in item.text(0).lower():
-                item.setHidden(False)
-            else:
-                item.setHidden(True)
+        query = text.lower()
+        top_level_item = self.articles_tree.topLevelItem
+        self.articles_tree.setUpdatesEnabled(False)
+        try:
+            for i in range(self.articles_tree.topLevelItemCount()):
+                item = top_level_item(i)
+                hidden = query not in item.search_text
+                # Only touch rows whose visibility actually changes
+                if item.isHidden() != hidden:
+                    item.setHidden(hidden)
+        finally:
+            self.articles_tree.setUpdatesEnabled(True)
 
     def refresh_feed(self):
         """Refreshes the selected feed."""
@@ -2179,39 +2719,74 @@ class RSSReader(QMainWindow):
             logging.warning("No feeds to refresh.")
             return
 
-        self.is_refreshing = True
-        self.refresh_icon_angle = 0
-        self.icon_rotation_timer.start(50)  # Rotate every 50ms
-        self.active_feed_threads = len(self.feeds)
+        self.active_feed_threads = 0
+        self.movie_data_misses.clear()  # A full refresh also retries the failed movie lookups
         logging.info("Starting force refresh of all feeds.")
 
+        # Feeds that are already being fetched are left to their running thread
         for feed_data in self.feeds:
             url = feed_data['url']
-            thread = FetchFeedThread(url)
-            thread.feed_fetched.connect(self.on_feed_fetched_force_refresh)
-            self.threads.append(thread)
-            thread.finished.connect(lambda t=thread: self.remove_thread(t))
-            thread.start()
-            logging.debug(f"Started thread for feed: {url}")
+            if self.start_feed_fetch(url, self.force_refresh_worker):
+                self.active_feed_threads += 1
+                logging.debug(f"Started thread for feed: {url}")
+
+        if self.active_feed_threads:
+            self.is_refreshing = True
+            self.refresh_icon_angle = 0
+            self.icon_rotation_timer.start(50)  # Rotate every 50ms
+
+    def merge_feed_entries(self, feed_data, entries):
+        """Adds unseen entries to the feed, returning them or None if the feed is unchanged."""
+        url = feed_data['url']
+        get_article_id = self.get_article_id
+        # Skip the merge entirely when the feed returned the same articles as last time,
+        # as long as the stored feed still holds all of them
+        fetched_ids = tuple(get_article_id(entry) for entry in entries)
+        entries_hash = hash(fetched_ids)
+        existing_ids = self.get_feed_article_ids(feed_data)
+        if self.entry_hashes_by_url.get(url) == entries_hash and existing_ids.issuperset(fetched_ids):
+            logging.debug(f"Feed {url} is unchanged since the last fetch.")
+            return None
+        self.entry_hashes_by_url[url] = entries_hash
+
+        new_entries = []
+        feed_entries = feed_data['entries']
+        # Resolve the feed's notification settings once rather than per new article
+        notify = self.are_notifications_enabled(url)
+        if not notify:
+            logging.debug(f"Notifications for feed '{feed_data['title']}' are disabled.")
+        for entry in entries:
+            article_id = get_article_id(entry)
+            if article_id not in existing_ids:
+                existing_ids.add(article_id)
+                feed_entries.append(entry)
+                new_entries.append(entry)
+                if notify:
+                    self.send_notification(feed_data['title'], entry)
+        if new_entries:
+            read_articles = self.read_articles
+            self.unread_counts[url] = self.unread_counts.get(url, 0) + sum(
+                1 for entry in new_entries if get_article_id(entry) not in read_articles
+            )
+            self.schedule_tray_tooltip_update()
+            # A refresh-all lands many feeds back to back; write feeds.json once for all of them
+            self.feeds_save_timer.start()
+        return new_entries
 
     def on_feed_fetched(self, url, feed):
         """Handles the feed fetched signal, updating the feed with new data and sending notifications."""
+        self.fetching_urls.discard(url)
         if feed is not None:
-            for feed_data in self.feeds:
-                if feed_data['url'] == url:
-                    new_entries = []
-                    existing_ids = {self.get_article_id(e) for e in feed_data.get('entries', [])}
-                    for entry in feed.entries:
-                        article_id = self.get_article_id(entry)
-                        if article_id not in existing_ids:
-                            feed_data['entries'].append(entry)
-                            new_entries.append(entry)
-                            self.send_notification(feed_data['title'], entry)
-                    break
+            feed_data = self.feeds_by_url.get(url)
+            if feed_data is None:
+                return
+            new_entries = self.merge_feed_entries(feed_data, feed.entries)
+            if new_entries is None:
+                return
             current_feed_item = self.feeds_list.currentItem()
             if current_feed_item and current_feed_item.data(0, Qt.UserRole) == url:
+                self.current_entries = feed_data['entries']
                 self.populate_articles()
-            self.save_read_articles()
             logging.info(f"Feed fetched: {url} with {len(new_entries)} new articles.")
         else:
             logging.warning(f"Failed to fetch feed: {url}")
@@ -2219,21 +2794,15 @@ class RSSReader(QMainWindow):
     def on_feed_fetched_force_refresh(self, url, feed):
         """Callback when a feed is forcefully refreshed and updates the new icon."""
         logging.debug(f"on_feed_fetched_force_refresh called for feed: {url}")
+        self.fetching_urls.discard(url)
+        new_entries = None
         if feed is not None:
-            for feed_data in self.feeds:
-                if feed_data['url'] == url:
-                    new_entries = []
-                    existing_ids = {self.get_article_id(e) for e in feed_data.get('entries', [])}
-                    for entry in feed.entries:
-                        article_id = self.get_article_id(entry)
-                        if article_id not in existing_ids:
-                            feed_data['entries'].append(entry)
-                            new_entries.append(entry)
-                            self.send_notification(feed_data['title'], entry)
-                    # **Update Feed Icon if New Entries are Added**
-                    if new_entries:
-                        self.set_feed_new_icon(url, True)
-                    break
+            feed_data = self.feeds_by_url.get(url)
+            if feed_data is not None:
+                new_entries = self.merge_feed_entries(feed_data, feed.entries)
+                # **Update Feed Icon if New Entries are Added**
+                if new_entries:
+                    self.set_feed_new_icon(url, True)
 
         else:
             logging.warning(f"Failed to fetch feed during force refresh: {url}")
@@ -2246,12 +2815,15 @@ class RSSReader(QMainWindow):
         if self.active_feed_threads == 0:
             self.is_refreshing = False  # Reset the flag
             self.icon_rotation_timer.stop()
-            self.force_refresh_action.setIcon(QIcon(self.force_refresh_icon_pixmap))
+            self.force_refresh_action.setIcon(self.refresh_icon_frames[0])
             logging.info("Completed force refresh of all feeds.")
         
         # **Refresh the Article List if the Current Feed is Being Updated**
+        if new_entries is None:
+            return
         current_feed = self.get_current_feed()
         if current_feed and current_feed['url'] == url:
+            self.current_entries = current_feed['entries']
             self.populate_articles()
 
 
@@ -2270,19 +2842,41 @@ class RSSReader(QMainWindow):
         menu.exec_(self.feeds_list.viewport().mapToGlobal(position))
 
         
+    def create_feed_item(self, feed):
+        """Creates a detached feeds list item for a feed and registers it under its URL."""
+        feed_item = QTreeWidgetItem()
+        feed_item.setText(0, feed['title'])
+        feed_item.setData(0, Qt.UserRole, feed['url'])
+        feed_item.setFlags(feed_item.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDragEnabled)
+        self.feed_items_by_url[feed['url']] = feed_item
+        return feed_item
+
     def set_feed_new_icon(self, url, has_new):
         """Sets or removes the new updates icon for a specific feed."""
-        for i in range(self.feeds_list.topLevelItemCount()):
-            group = self.feeds_list.topLevelItem(i)
-            for j in range(group.childCount()):
-                feed_item = group.child(j)
-                if feed_item.data(0, Qt.UserRole) == url:
-                    if has_new:
-                        new_icon = self.get_unread_icon()  # Use the blue dot icon
-                        feed_item.setIcon(0, new_icon)
-                    else:
-                        feed_item.setIcon(0, QIcon())  # Remove the icon
-                    return
+        # Opening any article clears the icon again, so skip items already in the right state
+        if (url in self.feeds_with_new_icon) == has_new:
+            return
+        if url not in self.feed_items_by_url:
+            return
+        if has_new:
+            self.feeds_with_new_icon.add(url)
+        else:
+            self.feeds_with_new_icon.discard(url)
+        # A refresh flips many feeds at once; paint them together on the next event loop turn
+        self.dirty_feed_icons.add(url)
+        if not self.feed_icon_flush_scheduled:
+            self.feed_icon_flush_scheduled = True
+            QTimer.singleShot(0, self.flush_feed_icons)
+
+    def flush_feed_icons(self):
+        """Applies the pending new updates icons in one pass."""
+        self.feed_icon_flush_scheduled = False
+        new_icon = self.get_unread_icon()  # Use the blue dot icon
+        for url in self.dirty_feed_icons:
+            feed_item = self.feed_items_by_url.get(url)
+            if feed_item is not None:
+                feed_item.setIcon(0, new_icon if url in self.feeds_with_new_icon else self.empty_icon)
+        self.dirty_feed_icons.clear()
 
     def import_feeds(self):
         """Imports feeds from a JSON file."""
@@ -2291,23 +2885,28 @@ class RSSReader(QMainWindow):
             try:
                 with open(file_name, 'r') as f:
                     feeds = json.load(f)
-                    for feed in feeds:
-                        if feed['url'] not in [f['url'] for f in self.feeds]:
-                            if 'sort_column' not in feed:
-                                feed['sort_column'] = 1
-                            if 'sort_order' not in feed:
-                                feed['sort_order'] = Qt.AscendingOrder
-                            if 'visible_columns' not in feed:
-                                feed['visible_columns'] = [True] * 6
-                            self.feeds.append(feed)
-                            parsed_url = urlparse(feed['url'])
-                            domain = parsed_url.netloc or 'Unknown Domain'
-                            group_name = self.group_name_mapping.get(domain, domain)
-                            existing_group = self.find_or_create_group(group_name, domain)
-                            feed_item = QTreeWidgetItem(existing_group)
-                            feed_item.setText(0, feed['title'])
-                            feed_item.setData(0, Qt.UserRole, feed['url'])
-                            feed_item.setFlags(feed_item.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDragEnabled)
+                # Collect the new feeds per group so each group receives its items in one call
+                grouped_items = {}
+                for feed in feeds:
+                    if feed['url'] not in self.feeds_by_url:
+                        if 'sort_column' not in feed:
+                            feed['sort_column'] = 1
+                        if 'sort_order' not in feed:
+                            feed['sort_order'] = Qt.AscendingOrder
+                        if 'visible_columns' not in feed:
+                            feed['visible_columns'] = [True] * 6
+                        feed.setdefault('entries', [])
+                        self.feeds.append(feed)
+                        self.feeds_by_url[feed['url']] = feed
+                        domain = self.get_feed_domain(feed['url'])
+                        group_name = self.group_name_mapping.get(domain, domain)
+                        grouped_items.setdefault((group_name, domain), []).append(self.create_feed_item(feed))
+                self.feeds_list.setUpdatesEnabled(False)
+                try:
+                    for (group_name, domain), feed_items in grouped_items.items():
+                        self.find_or_create_group(group_name, domain).addChildren(feed_items)
+                finally:
+                    self.feeds_list.setUpdatesEnabled(True)
                 self.save_feeds()
                 self.statusBar().showMessage("Feeds imported")
                 logging.info("Feeds imported successfully.")
@@ -2336,9 +2935,7 @@ class RSSReader(QMainWindow):
         if not current_feed:
             return
 
-        group_name = self.get_group_name_for_feed(current_feed['url'])
-        group_settings = self.group_settings.get(group_name, {'omdb_enabled': True})
-        omdb_enabled = group_settings.get('omdb_enabled', True)
+        omdb_enabled = self.is_omdb_enabled(current_feed['url'])
 
         for i in range(header.count()):
             column_name = header.model().headerData(i, Qt.Horizontal)
@@ -2348,7 +2945,7 @@ class RSSReader(QMainWindow):
             action.setChecked(visible)
             action.setData(i)
 
-            if not omdb_enabled and i > 1:
+            if not omdb_enabled and i in OMDB_COLUMNS:
                 # Disable toggling for columns beyond Title and Date
                 action.setEnabled(False)
 
@@ -2376,7 +2973,7 @@ class RSSReader(QMainWindow):
         if current_feed:
             current_feed['sort_column'] = column
             current_feed['sort_order'] = order
-            self.save_feeds()
+            self.feeds_save_timer.start()
             logging.debug(f"Sort settings updated for feed '{current_feed['title']}': column={column}, order={order}.")
 
     def select_first_feed(self):
@@ -2396,7 +2993,7 @@ def main():
     args = parser.parse_args()
 
     # Set the working directory to the script's directory
-    if getattr(sys, 'frozen', False):
+    if IS_FROZEN:
         application_path = os.path.dirname(sys.executable)
     else:
         application_path = os.path.dirname(os.path.abspath(__file__))
@@ -2435,25 +3032,14 @@ def main():
     splash.show()
     QApplication.processEvents()
 
-    # Initialize the main window
+    # Initialize the main window; it loads its settings and feeds while being constructed
+    splash.showMessage("Loading settings and feeds...", Qt.AlignBottom | Qt.AlignCenter, Qt.white)
+    QApplication.processEvents()
     reader = RSSReader()
     reader.show()
     reader.raise_()
     reader.activateWindow()  # Ensure that it gets focus
 
-    # Update splash screen message
-    splash.showMessage("Loading settings...", Qt.AlignBottom | Qt.AlignCenter, Qt.white)
-    QApplication.processEvents()
-    reader.load_settings()
-
-    splash.showMessage("Loading feeds...", Qt.AlignBottom | Qt.AlignCenter, Qt.white)
-    QApplication.processEvents()
-    reader.load_feeds()
-
-    splash.showMessage("Refreshing feeds...", Qt.AlignBottom | Qt.AlignCenter, Qt.white)
-    QApplication.processEvents()
-    
-
     splash.showMessage("Finalizing...", Qt.AlignBottom | Qt.AlignCenter, Qt.white)
     QApplication.processEvents()
     